@@ -72,6 +72,9 @@ class CameraManager:
             ]
             self.roi_regions_normalized = True
         
+        # Packed ROI geometry used for per-frame pixel conversion
+        self._build_roi_arrays()
+        
         # Color reference values (baseline)
         self.color_references = {}
         self.color_deltas = {}
@@ -417,6 +420,10 @@ class CameraManager:
             logger.error(f"Error reading frame: {str(e)}")
             return self.last_good_frame
     
+    def read_latest_nowait(self):
+        """Return the most recent raw frame without touching the buffer or the camera"""
+        return self.last_good_frame
+    
     def start_recording(self):
         """Start recording video"""
         try:
@@ -760,28 +767,47 @@ class CameraManager:
         """Check if camera is connected"""
         return self.cap is not None and self.cap.isOpened() and self.is_capturing and self.frames_processed > 0
 
-    def _calculate_lab_color(self, frame, roi):
-        """Calculate average LAB color values for a region of interest"""
-        h, w = frame.shape[:2]
+    def _build_roi_arrays(self):
+        """Pack ROI geometry into an (N, 4) array of x, y, width, height"""
+        self._roi_boxes = np.array(
+            [[roi["x"], roi["y"], roi["width"], roi["height"]] for roi in self.roi_regions],
+            dtype=np.float64
+        ).reshape(-1, 4)
         
-        # Handle normalized (0-1) coordinates or absolute pixel coordinates
-        if self.roi_regions_normalized or all(0 <= v <= 1 for v in [roi["x"], roi["y"], roi["width"], roi["height"]]):
-            x = int(roi["x"] * w)
-            y = int(roi["y"] * h)
-            width = int(roi["width"] * w)
-            height = int(roi["height"] * h)
-        else:
-            # Assume coordinates are already in pixels
-            x = int(roi["x"])
-            y = int(roi["y"])
-            width = int(roi["width"])
-            height = int(roi["height"])
+        # Rows are scaled by the frame size if the regions are normalized or the values are all within 0-1
+        self._roi_scaled = np.logical_or(
+            self.roi_regions_normalized,
+            np.all((self._roi_boxes >= 0) & (self._roi_boxes <= 1), axis=1)
+        )
+        
+        # Pixel boxes per frame shape, rebuilt whenever the ROI geometry changes
+        self._roi_px_cache = {}
+    
+    def _roi_pixel_boxes(self, h, w):
+        """Convert every ROI to a clipped pixel box (x, y, width, height) in one pass"""
+        if len(self._roi_boxes) != len(self.roi_regions):
+            self._build_roi_arrays()
+        
+        cached = self._roi_px_cache.get((h, w))
+        if cached is not None:
+            return cached
+        
+        scale = np.where(self._roi_scaled[:, None], np.array([w, h, w, h], dtype=np.float64), 1.0)
+        boxes = (self._roi_boxes * scale).astype(np.int32)
         
-        # Ensure ROI is within frame bounds
-        x = max(0, min(x, w - 1))
-        y = max(0, min(y, h - 1))
-        width = max(1, min(width, w - x))
-        height = max(1, min(height, h - y))
+        # Ensure ROIs are within frame bounds
+        x = np.clip(boxes[:, 0], 0, w - 1)
+        y = np.clip(boxes[:, 1], 0, h - 1)
+        width = np.clip(boxes[:, 2], 1, w - x)
+        height = np.clip(boxes[:, 3], 1, h - y)
+        
+        cached = np.stack([x, y, width, height], axis=1).tolist()
+        self._roi_px_cache[(h, w)] = cached
+        return cached
+    
+    def _calculate_lab_color(self, frame, box):
+        """Calculate average LAB color values for a region of interest given as a pixel box"""
+        x, y, width, height = box
         
         # Extract ROI
         roi_region = frame[y:y+height, x:x+width]
@@ -817,11 +843,14 @@ class CameraManager:
         visible_distances = []
         obscured_distances = []
         
+        # Convert all ROIs to pixel boxes once for this frame
+        boxes = self._roi_pixel_boxes(*frame.shape[:2])
+        
         # Loop through each ROI region
-        for roi in self.roi_regions:
+        for roi, box in zip(self.roi_regions, boxes):
             roi_name = roi["name"]
             distance = roi.get("distance", 0)
-            current_color = self._calculate_lab_color(frame, roi)
+            current_color = self._calculate_lab_color(frame, box)
             
             # If we're still building reference values
             if self.reference_frame_count < self.reference_frame_needed:
@@ -931,28 +960,9 @@ class CameraManager:
         min_visible_distance = float('inf')
         max_obscured_distance = 0
         
-        for roi in self.roi_regions:
+        for roi, (x, y, width, height) in zip(self.roi_regions, self._roi_pixel_boxes(h, w)):
             roi_name = roi["name"]
             
-            # Handle normalized (0-1) coordinates or absolute pixel coordinates
-            if self.roi_regions_normalized or all(0 <= v <= 1 for v in [roi["x"], roi["y"], roi["width"], roi["height"]]):
-                x = int(roi["x"] * w)
-                y = int(roi["y"] * h)
-                width = int(roi["width"] * w)
-                height = int(roi["height"] * h)
-            else:
-                # Assume coordinates are already in pixels
-                x = int(roi["x"])
-                y = int(roi["y"])
-                width = int(roi["width"])
-                height = int(roi["height"])
-            
-            # Ensure coordinates are within frame bounds
-            x = max(0, min(x, w - 1))
-            y = max(0, min(y, h - 1))
-            width = max(1, min(width, w - x))
-            height = max(1, min(height, h - y))
-            
             # Default color (green)
             color = (0, 255, 0)
             
@@ -1038,6 +1048,7 @@ class CameraManager:
         """
         self.roi_regions = roi_regions
         self.roi_regions_normalized = normalized
+        self._build_roi_arrays()
         logger.info(f"Set {len(roi_regions)} ROI regions for camera {self.camera_id}")
         
         return True
@@ -1070,7 +1081,6 @@ class CameraManager:
                 # Check if it's time to update analytics
                 if self.analytics_enabled and (time.time() - self.last_analytics_update) >= self.analytics_refresh_interval:
                     self._update_analytics()
-                    self.last_analytics_update = time.time()
                 
                 # Skip frame read if too little time has passed
                 time_since_last = time.time() - last_frame_time
@@ -1275,6 +1285,12 @@ class CameraManager:
 
     def _update_analytics(self):
         """Update analytics based on the current frame"""
+        # Coalesce calls that arrive within the refresh interval
+        now = time.time()
+        if now - self.last_analytics_update < self.analytics_refresh_interval:
+            return True
+        self.last_analytics_update = now
+        
         try:
             # If we have a last good frame, use it for analytics
             if self.last_good_frame is not None:
@@ -1286,8 +1302,6 @@ class CameraManager:
                 logger.warning(f"No frame available for camera {self.camera_id}, using test metrics")
                 self.force_update_metrics()
                 
-            # Update the last analytics update timestamp
-            self.last_analytics_update = time.time()
             return True
         except Exception as e:
             logger.error(f"Error updating analytics for camera {self.camera_id}: {str(e)}")
@@ -270,6 +270,6 @@ class SystemMonitor:
         metrics = self._collect_metrics()
         return metrics
         
-    def get_metrics_history(self, hours=24):
-        """Get metrics history for the specified time period"""
-        return self.db_manager.get_performance_history(hours) 
\ No newline at end of file
+    def get_metrics_history(self, hours=24, layout='aos', bucket=None):
+        """Get metrics history for the specified time period, optionally aggregated per time bucket"""
+        return self.db_manager.get_performance_history(hours, layout=layout, bucket=bucket) 
\ No newline at end of file
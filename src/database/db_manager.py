@@ -4,11 +4,26 @@ import datetime
 import os
 import threading
 import queue
+import numpy as np
+from contextlib import contextmanager
 from pathlib import Path
 from ..config.settings import DATA_DIR
 
 logger = logging.getLogger(__name__)
 
+# Numeric columns returned by get_performance_history, in SELECT order
+_PERFORMANCE_HISTORY_FIELDS = (
+    'cpu_usage', 'memory_usage', 'frames_processed',
+    'processing_time', 'camera_count', 'error_count'
+)
+
+# strftime formats that truncate a stored timestamp to the start of its bucket
+_HISTORY_BUCKET_FORMATS = {
+    'minute': '%Y-%m-%d %H:%M:00',
+    'hour': '%Y-%m-%d %H:00:00',
+    'day': '%Y-%m-%d 00:00:00'
+}
+
 class DatabaseManager:
     _instance = None
     _lock = threading.Lock()
@@ -64,14 +79,18 @@ class DatabaseManager:
                 str(self.db_path), 
                 timeout=30.0,
                 isolation_level=None,  # Enable autocommit mode
-                check_same_thread=False  # Allow connections to be used across threads
+                check_same_thread=False,  # Allow connections to be used across threads
+                cached_statements=256  # Reuse prepared statements for repeated SQL text
             )
             
-            # Set pragmas for better performance
+            # Set pragmas for better performance; auto_vacuum must precede WAL to apply to a new file
+            connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
             connection.execute("PRAGMA journal_mode = WAL")
             connection.execute("PRAGMA synchronous = NORMAL")
             connection.execute("PRAGMA foreign_keys = ON")
             connection.execute("PRAGMA cache_size = 10000")  # 10MB cache
+            connection.execute("PRAGMA temp_store = MEMORY")
+            connection.execute("PRAGMA mmap_size = 268435456")  # 256MB memory-mapped reads
             
             return connection
         except Exception as e:
@@ -139,6 +158,15 @@ class DatabaseManager:
             except:
                 pass
     
+    @contextmanager
+    def connection(self):
+        """Borrow a pooled connection for the duration of a with block"""
+        conn = self.get_connection()
+        try:
+            yield conn
+        finally:
+            self.release_connection(conn)
+    
     def cleanup(self):
         """Clean up all database connections"""
         logger.info("Cleaning up database connections")
@@ -249,6 +277,11 @@ class DatabaseManager:
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_camera_timestamp ON events(camera_id, timestamp)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_performance_metrics_timestamp ON performance_metrics(timestamp)")
             
+            # Gather planner statistics once so row counts can be read from sqlite_stat1
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+            if cursor.fetchone() is None:
+                cursor.execute("ANALYZE")
+            
             conn.commit()
             logger.info("Database setup completed successfully")
             
@@ -610,6 +643,36 @@ class DatabaseManager:
             logger.error(f"Database backup failed: {str(e)}")
             return False
     
+    def optimize_database(self, max_pages=1000):
+        """Reclaim free pages, at most max_pages at a time once incremental auto-vacuum is enabled,
+        and refresh the planner statistics that back the approximate row counts
+        
+        Args:
+            max_pages (int): Maximum number of free pages to release per call
+        
+        Returns:
+            bool: True if the optimization succeeded, False otherwise
+        """
+        try:
+            with self.connection() as conn:
+                # Files created before incremental auto-vacuum need one full VACUUM to switch mode
+                if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                    conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                    conn.execute("VACUUM")
+                else:
+                    # Step the pragma to completion, otherwise only one page is freed
+                    conn.execute(f"PRAGMA incremental_vacuum({int(max_pages)})").fetchall()
+                
+                # Re-gather sqlite_stat1 so row counts read from it track table growth
+                conn.execute("ANALYZE")
+                conn.commit()
+            
+            logger.info("Database optimization completed")
+            return True
+        except Exception as e:
+            logger.error(f"Database optimization failed: {str(e)}")
+            return False
+    
     def execute_with_transaction(self, query, params=None):
         """Execute a query within a transaction with proper error handling"""
         conn = None
@@ -731,14 +794,18 @@ class DatabaseManager:
         finally:
             self.release_connection(conn)
             
-    def get_performance_history(self, hours=24):
+    def get_performance_history(self, hours=24, layout='aos', bucket=None):
         """Get performance metrics history for the specified time period
         
         Args:
             hours (int): Number of hours to look back
+            layout (str): 'aos' for a list of row dicts, 'soa' for a dict of column arrays
+            bucket (str): 'minute', 'hour' or 'day' to aggregate rows per time bucket in SQL,
+                or None for the raw samples
             
         Returns:
-            list: List of performance metric records
+            list: List of performance metric records, or dict of numpy arrays
+                (timestamps as datetime64[s], metrics as float32) when layout is 'soa'
         """
         conn = None
         try:
@@ -747,20 +814,47 @@ class DatabaseManager:
             
             time_threshold = datetime.datetime.now() - datetime.timedelta(hours=hours)
             
-            cursor.execute("""
-                SELECT 
-                    timestamp, cpu_usage, memory_usage, frames_processed, 
-                    processing_time, camera_count, error_count
-                FROM 
-                    performance_metrics
-                WHERE 
-                    timestamp > ?
-                ORDER BY 
-                    timestamp ASC
-            """, (time_threshold,))
+            if bucket is None:
+                cursor.execute("""
+                    SELECT 
+                        timestamp, cpu_usage, memory_usage, frames_processed, 
+                        processing_time, camera_count, error_count
+                    FROM 
+                        performance_metrics
+                    WHERE 
+                        timestamp > ?
+                    ORDER BY 
+                        timestamp ASC
+                """, (time_threshold,))
+            else:
+                # Aggregate in SQLite so only one row per bucket crosses into Python;
+                # error_count is a running total, so the bucket keeps its latest (max) value
+                if bucket not in _HISTORY_BUCKET_FORMATS:
+                    raise ValueError(f"Unknown history bucket: {bucket}")
+                cursor.execute("""
+                    SELECT 
+                        strftime(?, timestamp) AS bucket, AVG(cpu_usage), AVG(memory_usage),
+                        SUM(frames_processed), AVG(processing_time), MAX(camera_count), MAX(error_count)
+                    FROM 
+                        performance_metrics
+                    WHERE 
+                        timestamp > ?
+                    GROUP BY 
+                        bucket
+                    ORDER BY 
+                        bucket ASC
+                """, (_HISTORY_BUCKET_FORMATS[bucket], time_threshold))
             
             results = cursor.fetchall()
             
+            if layout == 'soa':
+                # One array per column instead of one dict per row
+                columns = list(zip(*results)) or [()] * 7
+                metrics_history = {'timestamp': np.array(columns[0], dtype='datetime64[s]')}
+                for name, values in zip(_PERFORMANCE_HISTORY_FIELDS, columns[1:]):
+                    metrics_history[name] = np.array(values, dtype=np.float32)
+                return metrics_history
+            
             # Convert to list of dictionaries
             metrics_history = []
             for row in results:
@@ -778,7 +872,7 @@ class DatabaseManager:
             
         except Exception as e:
             logger.error(f"Error retrieving performance history: {str(e)}")
-            return []
+            return {} if layout == 'soa' else []
         finally:
             self.release_connection(conn)
     
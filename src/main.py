@@ -38,6 +38,157 @@ except Exception as e:
     logger.error(f"Error initializing AnalyticsManager: {str(e)}")
     analytics_manager = None
 
+# Seconds between camera analytics samples
+ANALYTICS_INTERVAL = 5
+
+@st.fragment(run_every=ANALYTICS_INTERVAL)
+def update_analytics():
+    """Sample every connected camera into the history graphs and the analytics store"""
+    camera_manager = st.session_state.camera_managers[st.session_state.selected_camera]
+    
+    # First update the selected camera (which is already being processed)
+    camera_status = camera_manager.get_status()
+    
+    # Initialize camera data if it doesn't exist
+    if st.session_state.selected_camera not in st.session_state.cameras_data:
+        st.session_state.cameras_data[st.session_state.selected_camera] = {
+            'timestamps': [],
+            'brightness_history': [],
+            'visibility_history': []
+        }
+    
+    # Get the camera data for the current camera
+    camera_data = st.session_state.cameras_data[st.session_state.selected_camera]
+    
+    # Update all metrics
+    camera_data['color_deltas'] = camera_manager.color_deltas
+    camera_data['brightness'] = camera_status.get('brightness', 0)
+    camera_data['contrast'] = camera_status.get('contrast', 0)
+    camera_data['sharpness'] = camera_status.get('sharpness', 0)
+    camera_data['edge_score'] = camera_status.get('edge_score', 0)
+    camera_data['visibility_score'] = camera_status.get('visibility_score', 0)
+    camera_data['color_delta_avg'] = camera_status.get('color_delta_avg', 0)
+    camera_data['visibility_status'] = camera_status.get('visibility_status', 'Unknown')
+    
+    # Store data for history graphs
+    current_time_dt = datetime.now()
+    camera_data['timestamps'].append(current_time_dt)
+    camera_data['brightness_history'].append(camera_data['brightness'])
+    
+    # Store visibility history including distance information
+    if 'visibility_history' not in camera_data:
+        camera_data['visibility_history'] = []
+    
+    visibility_entry = {
+        'timestamp': current_time_dt,
+        'score': camera_data['visibility_score'],
+        'status': camera_data['visibility_status'],
+        'brightness': camera_data['brightness']
+    }
+    
+    # Add visibility distance if available
+    if hasattr(camera_manager, 'visibility_distance'):
+        visibility_entry['visibility_distance'] = camera_manager.visibility_distance
+    
+    camera_data['visibility_history'].append(visibility_entry)
+    
+    # Keep only last 100 data points
+    if len(camera_data['timestamps']) > 100:
+        camera_data['timestamps'] = camera_data['timestamps'][-100:]
+        camera_data['brightness_history'] = camera_data['brightness_history'][-100:]
+        camera_data['visibility_history'] = camera_data['visibility_history'][-100:]
+    
+    # Store updated data back to session state
+    st.session_state.cameras_data[st.session_state.selected_camera] = camera_data
+    
+    # Now update analytics for all other connected cameras
+    for cam_id, cam_manager in st.session_state.camera_managers.items():
+        # Skip the currently selected camera which was already processed
+        if cam_id == st.session_state.selected_camera:
+            continue
+        
+        # Only process cameras that are connected
+        if cam_manager.is_connected():
+            # Get camera status
+            try:
+                cam_status = cam_manager.get_status()
+                
+                # Initialize camera data if it doesn't exist
+                if cam_id not in st.session_state.cameras_data:
+                    st.session_state.cameras_data[cam_id] = {
+                        'timestamps': [],
+                        'brightness_history': [],
+                        'visibility_history': []
+                    }
+                
+                # Get the camera data
+                cam_data = st.session_state.cameras_data[cam_id]
+                
+                # Update metrics
+                cam_data['color_deltas'] = cam_manager.color_deltas
+                cam_data['brightness'] = cam_status.get('brightness', 0)
+                cam_data['contrast'] = cam_status.get('contrast', 0)
+                cam_data['sharpness'] = cam_status.get('sharpness', 0)
+                cam_data['edge_score'] = cam_status.get('edge_score', 0)
+                cam_data['visibility_score'] = cam_status.get('visibility_score', 0)
+                cam_data['color_delta_avg'] = cam_status.get('color_delta_avg', 0)
+                cam_data['visibility_status'] = cam_status.get('visibility_status', 'Unknown')
+                
+                # Store data for history
+                cam_data['timestamps'].append(current_time_dt)
+                cam_data['brightness_history'].append(cam_data['brightness'])
+                
+                # Store visibility history
+                if 'visibility_history' not in cam_data:
+                    cam_data['visibility_history'] = []
+                
+                cam_visibility_entry = {
+                    'timestamp': current_time_dt,
+                    'score': cam_data['visibility_score'],
+                    'status': cam_data['visibility_status'],
+                    'brightness': cam_data['brightness']
+                }
+                
+                # Add visibility distance if available
+                if hasattr(cam_manager, 'visibility_distance'):
+                    cam_visibility_entry['visibility_distance'] = cam_manager.visibility_distance
+                
+                cam_data['visibility_history'].append(cam_visibility_entry)
+                
+                # Keep only last 100 data points
+                if len(cam_data['timestamps']) > 100:
+                    cam_data['timestamps'] = cam_data['timestamps'][-100:]
+                    cam_data['brightness_history'] = cam_data['brightness_history'][-100:]
+                    cam_data['visibility_history'] = cam_data['visibility_history'][-100:]
+                
+                # Update analytics database
+                if analytics_manager:
+                    analytics_manager.update_daily_stats(
+                        camera_id=cam_id,
+                        brightness=cam_status.get('brightness', 0),
+                        contrast=cam_status.get('contrast', 0),
+                        visibility_score=cam_status.get('visibility_score', 0),
+                        visibility_status=cam_status.get('visibility_status', 'Unknown')
+                    )
+                
+                # Store updated data back to session state
+                st.session_state.cameras_data[cam_id] = cam_data
+            
+            except Exception as e:
+                logger.error(f"Error updating analytics for camera {cam_id}: {str(e)}")
+    
+    # Update analytics with current camera metrics
+    analytics_manager.update_daily_stats(
+        camera_id=st.session_state.selected_camera,
+        brightness=camera_status.get('brightness', 0),
+        contrast=camera_status.get('contrast', 0),
+        visibility_score=camera_status.get('visibility_score', 0),
+        visibility_status=camera_status.get('visibility_status', 'Unknown')
+    )
+    
+    # Log analytics update
+    logger.info(f"Updated analytics for all cameras")
+
 def main():
     """Main application entry point"""
     try:
@@ -140,6 +291,9 @@ def main():
             prev_camera_id = st.session_state.selected_camera
             
             try:
+                # Stop the live feed thread reading from the previous camera
+                UIComponents.stop_feed_thread()
+                
                 # Safely disconnect the previous camera
                 if prev_camera_id in st.session_state.camera_managers:
                     prev_camera_manager = st.session_state.camera_managers[prev_camera_id]
@@ -335,21 +489,8 @@ def main():
             else:
                 logger.warning(f"No cached weather data available for {weather_city}")
         
-        # Create main content with camera feed container
-        feed_container = st.empty()
-        
-        # Create main content with tabs
-        tabs = UIComponents.create_main_content(camera_config, camera_manager.get_status(), weather_data, feed_container)
-        
-        # Status placeholder for messages
-        placeholder = st.empty()
-        
-        # Frame rate control
-        target_fps = display_settings.get('fps', 15)
-        frame_interval = 1.0 / target_fps  # Time between frames
-        
-        # Analytics update interval (30 seconds)
-        analytics_interval = 5  # Reduce from 30 to 5 seconds for testing
+        # Create main content with tabs; the Live Monitoring tab runs the camera feed
+        tabs = UIComponents.create_main_content(camera_config, camera_manager.get_status(), weather_data)
         
         # Initialize the camera data structure if it doesn't exist yet
         if st.session_state.selected_camera not in st.session_state.cameras_data:
@@ -368,212 +509,9 @@ def main():
                     'visibility_history': []
                 }
         
-        # Force an immediate analytics update
-        st.session_state.last_analytics_update = time.time() - analytics_interval - 1
-        
-        # Streaming loop with controlled frame rate
-        while st.session_state.streaming and camera_manager.is_connected():
-            try:
-                # Calculate time since last frame
-                current_time = time.time()
-                time_since_last_frame = current_time - st.session_state.last_frame_time
-                
-                # Update analytics data periodically
-                if analytics_manager and current_time - st.session_state.last_analytics_update > analytics_interval:
-                    # First update the selected camera (which is already being processed)
-                    camera_status = camera_manager.get_status()
-                    
-                    # Initialize camera data if it doesn't exist
-                    if st.session_state.selected_camera not in st.session_state.cameras_data:
-                        st.session_state.cameras_data[st.session_state.selected_camera] = {
-                            'timestamps': [],
-                            'brightness_history': [],
-                            'visibility_history': []
-                        }
-                    
-                    # Get the camera data for the current camera
-                    camera_data = st.session_state.cameras_data[st.session_state.selected_camera]
-                    
-                    # Update all metrics
-                    camera_data['color_deltas'] = camera_manager.color_deltas
-                    camera_data['brightness'] = camera_status.get('brightness', 0)
-                    camera_data['contrast'] = camera_status.get('contrast', 0)
-                    camera_data['sharpness'] = camera_status.get('sharpness', 0)
-                    camera_data['edge_score'] = camera_status.get('edge_score', 0)
-                    camera_data['visibility_score'] = camera_status.get('visibility_score', 0)
-                    camera_data['color_delta_avg'] = camera_status.get('color_delta_avg', 0)
-                    camera_data['visibility_status'] = camera_status.get('visibility_status', 'Unknown')
-                    
-                    # Store data for history graphs
-                    current_time_dt = datetime.now()
-                    camera_data['timestamps'].append(current_time_dt)
-                    camera_data['brightness_history'].append(camera_data['brightness'])
-                    
-                    # Store visibility history including distance information
-                    if 'visibility_history' not in camera_data:
-                        camera_data['visibility_history'] = []
-                        
-                    visibility_entry = {
-                        'timestamp': current_time_dt,
-                        'score': camera_data['visibility_score'],
-                        'status': camera_data['visibility_status'],
-                        'brightness': camera_data['brightness']
-                    }
-                    
-                    # Add visibility distance if available
-                    if hasattr(camera_manager, 'visibility_distance'):
-                        visibility_entry['visibility_distance'] = camera_manager.visibility_distance
-                        
-                    camera_data['visibility_history'].append(visibility_entry)
-                    
-                    # Keep only last 100 data points
-                    if len(camera_data['timestamps']) > 100:
-                        camera_data['timestamps'] = camera_data['timestamps'][-100:]
-                        camera_data['brightness_history'] = camera_data['brightness_history'][-100:]
-                        camera_data['visibility_history'] = camera_data['visibility_history'][-100:]
-                    
-                    # Store updated data back to session state
-                    st.session_state.cameras_data[st.session_state.selected_camera] = camera_data
-                    
-                    # Now update analytics for all other connected cameras
-                    for cam_id, cam_manager in st.session_state.camera_managers.items():
-                        # Skip the currently selected camera which was already processed
-                        if cam_id == st.session_state.selected_camera:
-                            continue
-                            
-                        # Only process cameras that are connected
-                        if cam_manager.is_connected():
-                            # Get camera status
-                            try:
-                                cam_status = cam_manager.get_status()
-                                
-                                # Initialize camera data if it doesn't exist
-                                if cam_id not in st.session_state.cameras_data:
-                                    st.session_state.cameras_data[cam_id] = {
-                                        'timestamps': [],
-                                        'brightness_history': [],
-                                        'visibility_history': []
-                                    }
-                                
-                                # Get the camera data
-                                cam_data = st.session_state.cameras_data[cam_id]
-                                
-                                # Update metrics
-                                cam_data['color_deltas'] = cam_manager.color_deltas
-                                cam_data['brightness'] = cam_status.get('brightness', 0)
-                                cam_data['contrast'] = cam_status.get('contrast', 0)
-                                cam_data['sharpness'] = cam_status.get('sharpness', 0)
-                                cam_data['edge_score'] = cam_status.get('edge_score', 0)
-                                cam_data['visibility_score'] = cam_status.get('visibility_score', 0)
-                                cam_data['color_delta_avg'] = cam_status.get('color_delta_avg', 0)
-                                cam_data['visibility_status'] = cam_status.get('visibility_status', 'Unknown')
-                                
-                                # Store data for history
-                                cam_data['timestamps'].append(current_time_dt)
-                                cam_data['brightness_history'].append(cam_data['brightness'])
-                                
-                                # Store visibility history
-                                if 'visibility_history' not in cam_data:
-                                    cam_data['visibility_history'] = []
-                                    
-                                cam_visibility_entry = {
-                                    'timestamp': current_time_dt,
-                                    'score': cam_data['visibility_score'],
-                                    'status': cam_data['visibility_status'],
-                                    'brightness': cam_data['brightness']
-                                }
-                                
-                                # Add visibility distance if available
-                                if hasattr(cam_manager, 'visibility_distance'):
-                                    cam_visibility_entry['visibility_distance'] = cam_manager.visibility_distance
-                                    
-                                cam_data['visibility_history'].append(cam_visibility_entry)
-                                
-                                # Keep only last 100 data points
-                                if len(cam_data['timestamps']) > 100:
-                                    cam_data['timestamps'] = cam_data['timestamps'][-100:]
-                                    cam_data['brightness_history'] = cam_data['brightness_history'][-100:]
-                                    cam_data['visibility_history'] = cam_data['visibility_history'][-100:]
-                                
-                                # Update analytics database
-                                if analytics_manager:
-                                    analytics_manager.update_daily_stats(
-                                        camera_id=cam_id,
-                                        brightness=cam_status.get('brightness', 0),
-                                        contrast=cam_status.get('contrast', 0),
-                                        visibility_score=cam_status.get('visibility_score', 0),
-                                        visibility_status=cam_status.get('visibility_status', 'Unknown')
-                                    )
-                                
-                                # Store updated data back to session state
-                                st.session_state.cameras_data[cam_id] = cam_data
-                                
-                            except Exception as e:
-                                logger.error(f"Error updating analytics for camera {cam_id}: {str(e)}")
-                    
-                    # Update analytics with current camera metrics
-                    if analytics_manager:
-                        analytics_manager.update_daily_stats(
-                            camera_id=st.session_state.selected_camera,
-                            brightness=camera_status.get('brightness', 0),
-                            contrast=camera_status.get('contrast', 0),
-                            visibility_score=camera_status.get('visibility_score', 0),
-                            visibility_status=camera_status.get('visibility_status', 'Unknown')
-                        )
-                        
-                        # Log analytics update
-                        logger.info(f"Updated analytics for all cameras")
-                    
-                    st.session_state.last_analytics_update = current_time
-                
-                # Skip frames if we're updating too fast
-                if time_since_last_frame < frame_interval:
-                    time.sleep(max(0, frame_interval - time_since_last_frame) * 0.8)  # Add 20% margin
-                    continue
-                
-                # Read frame from buffer
-                frame = camera_manager.read_frame()
-                if frame is not None and frame.size > 0:
-                    # Only show ROI overlay if enabled in settings
-                    if hasattr(st.session_state, 'show_roi') and st.session_state.show_roi:
-                        # ROI overlay is already added by the camera manager's _process_frame method
-                        pass
-                    
-                    # Display frame
-                    feed_container.image(frame, channels="BGR", use_container_width=True)
-                    st.session_state.last_frame_time = time.time()
-                    
-                    # Write frame to recording if active
-                    camera_manager.write_frame(frame)
-                    
-                else:
-                    # If frame is invalid and camera is disconnected, try to reconnect
-                    if not camera_manager.is_connected():
-                        placeholder.warning("Camera disconnected. Attempting to reconnect...")
-                        camera_manager.reconnect()
-                        if not camera_manager.is_connected():
-                            placeholder.error("Failed to reconnect. Click 'Reconnect Camera' to try again manually.")
-                            break
-                        placeholder.success("Camera reconnected successfully.")
-                        continue
-                    
-                    # Add short delay if no frame is available
-                    time.sleep(0.1)
-                    
-            except Exception as e:
-                logger.error(f"Error in streaming loop: {str(e)}")
-                placeholder.error(f"Error: {str(e)}")
-                if not camera_manager.is_connected():
-                    # Attempt to reconnect automatically
-                    placeholder.warning("Attempting to reconnect due to error...")
-                    if camera_manager.reconnect():
-                        placeholder.success("Camera reconnected successfully after error.")
-                        continue
-                    else:
-                        placeholder.error("Failed to reconnect after error.")
-                        break
-                time.sleep(1)  # Wait a bit before retrying
-                continue
+        # Sample camera metrics on a timer instead of inside a blocking streaming loop
+        if analytics_manager:
+            update_analytics()
         
         # Update save_roi_configuration button in UI Component to directly save to config
         if 'save_roi_button_clicked' in st.session_state and st.session_state.save_roi_button_clicked:
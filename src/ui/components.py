@@ -1,4 +1,5 @@
 import streamlit as st
+from streamlit.errors import StreamlitAPIException
 import plotly.graph_objects as go
 import pandas as pd
 from datetime import datetime, timedelta
@@ -9,16 +10,839 @@ import sqlite3
 import threading
 import time
 import logging
-from queue import Queue
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from ..config.settings import DEFAULT_DISPLAY_SETTINGS, RECORDINGS_DIR, HIGHLIGHTS_DIR
 import plotly.express as px
 import json
+import base64
+import html
 from plotly.subplots import make_subplots
-import random
+import requests
+from functools import lru_cache
+from operator import itemgetter
+from dataclasses import dataclass, asdict
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Custom CSS for the dashboard, built once at import time
+_APP_CSS = """
+<style>
+    /* Main theme colors */
+    :root {
+        --primary-color: #1E88E5;
+        --secondary-color: #0D47A1;
+        --background-color: transparent;
+        --card-background: transparent;
+        --text-color: #212121;
+        --border-color: #e0e0e0;
+    }
+    
+    /* Keep every Streamlit surface transparent with a single rule */
+    .stApp, .main, div, section[data-testid="stSidebar"],
+    .main-header, .sub-header, .card, .camera-selector, .stMetric,
+    .stTabs [data-baseweb="tab"], .stTabContent,
+    .stTextInput input, .stNumberInput input, .stSelectbox select {
+        background-color: var(--background-color) !important;
+    }
+    
+    /* Header styles */
+    .main-header {
+        font-size: 2.5rem;
+        margin-bottom: 1rem;
+        color: var(--primary-color);
+        text-align: center;
+        font-weight: 600;
+    }
+    
+    /* Sub-header styles */
+    .sub-header {
+        font-size: 1.5rem;
+        margin-top: 1rem;
+        margin-bottom: 0.5rem;
+        color: var(--secondary-color);
+        font-weight: 500;
+    }
+    
+    /* Card styles */
+    .card {
+        border-radius: 10px;
+        padding: 20px;
+        margin-bottom: 20px;
+    }
+    
+    /* Status indicators */
+    .indicator {
+        font-size: 1.2rem;
+        font-weight: 500;
+        display: inline-block;
+        padding: 8px 16px;
+        border-radius: 5px;
+        margin: 4px;
+    }
+    
+    .good-visibility {
+        background-color: #e8f5e9;
+        color: #2e7d32;
+        border: 1px solid #a5d6a7;
+    }
+    
+    .poor-visibility {
+        background-color: #ffebee;
+        color: #c62828;
+        border: 1px solid #ef9a9a;
+    }
+    
+    /* Camera selector */
+    .camera-selector {
+        border-radius: 10px;
+        padding: 15px;
+        margin-bottom: 20px;
+    }
+    
+    /* Button styles */
+    .stButton button {
+        background-color: var(--primary-color);
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 8px 16px;
+        font-weight: 500;
+        transition: background-color 0.3s;
+    }
+    
+    .stButton button:hover {
+        background-color: var(--secondary-color);
+    }
+    
+    /* Input styles */
+    .stTextInput input, .stNumberInput input, .stSelectbox select {
+        border: 1px solid var(--border-color);
+        border-radius: 5px;
+        padding: 8px;
+    }
+    
+    /* Metric styles */
+    .stMetric {
+        border-radius: 5px;
+        padding: 10px;
+        margin: 5px;
+    }
+    
+    /* Tab styles */
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 2px;
+    }
+    
+    .stTabs [data-baseweb="tab"] {
+        border-radius: 5px 5px 0 0;
+        padding: 10px 20px;
+    }
+    
+    /* Make plotly charts background transparent */
+    .js-plotly-plot .plotly .main-svg,
+    .js-plotly-plot .plotly .modebar {
+        background: transparent !important;
+    }
+    
+    /* Ensure text remains visible */
+    .stMarkdown, .stText {
+        color: var(--text-color) !important;
+    }
+    
+    
+    /* Style the tab content area */
+    .stTabContent {
+        padding: 1rem 0;
+    }
+</style>
+"""
+
+# Labels for the main content tabs
+_TAB_LABELS = (
+    "📡 Live Monitoring",
+    "📊 Analytics",
+    "🌦️ Weather Insights",
+    "🔍 ROI Configuration",
+    "📼 Recordings",
+    "🔍 Highlights",
+    "📆 Historical Data",
+    "📹 Camera Grid",
+    "📋 Dashboard Overview",
+    "⚙️ Performance"
+)
+
+# Draws a separator above each sidebar settings section heading
+_SIDEBAR_CSS = """<style>
+section[data-testid="stSidebar"] h3:not([id="camera-selection"]) {
+    border-top: 1px solid rgba(128, 128, 128, 0.3);
+    margin-top: 1rem;
+    padding-top: 1.5rem;
+}
+</style>"""
+
+# Styles shipped with the analytics metric grid (setup_css is optional, so they travel with the markup)
+_METRIC_GRID_CSS = """<style>
+.metric-grid { display: grid; grid-template-columns: repeat(3, 1fr); gap: 10px; }
+.metric-card { border-radius: 5px; padding: 10px; }
+.metric-card label { display: block; font-size: 0.875rem; }
+.metric-card .metric-value { display: block; font-size: 2rem; }
+</style>"""
+
+# Styles shipped with the live feed frame and its timestamp overlay
+_FEED_FRAME_CSS = """<style>
+.feed-frame { position: relative; }
+.feed-frame img { width: 100%; }
+.ts-overlay { position: absolute; top: 8px; left: 8px; color: #0f0; font: 600 14px monospace; }
+</style>"""
+
+# Styles shipped with the camera grid markup
+_CAMERA_GRID_CSS = """<style>
+.camera-grid { display: grid; gap: 10px; }
+.camera-cell img { width: 100%; }
+.camera-cell figcaption { font-size: 0.875rem; opacity: 0.7; }
+.camera-cell .cam-state { font-weight: bold; }
+.camera-cell .cam-metrics { display: flex; justify-content: space-between; }
+</style>"""
+
+# Default visibility thresholds when a camera config doesn't set them
+_THRESHOLD_DEFAULTS = {
+    'brightness_threshold': 50,
+    'contrast_threshold': 30,
+    'edge_threshold': 20,
+    'visibility_threshold': 70
+}
+
+# Default values for a new ROI in the configuration form
+_ROI_DEFAULTS = {
+    "name": "New ROI",
+    "x": 0.1,
+    "y": 0.1,
+    "width": 0.2,
+    "height": 0.2,
+    "distance": 100
+}
+
+@dataclass
+class ROIForm:
+    """Values submitted from the Add/Edit ROI form"""
+    name: str
+    x: float
+    y: float
+    width: float
+    height: float
+    distance: int
+
+# Help text shown in the ROI configuration tab
+_ROI_HELP_TEXT = """
+**Region of Interest (ROI) Configuration**
+
+ROIs are areas of the camera frame that are analyzed for visibility changes:
+
+- **Position (X,Y)**: The top-left corner of the ROI relative to the frame (0-1)
+- **Width/Height**: Size of the ROI relative to the frame size (0-1)
+- **Distance**: Estimated distance in meters to the ROI area, used for visibility distance estimation
+
+Each ROI is analyzed separately, and the system detects visibility changes in each region.
+Place ROIs at different distances to help estimate visibility range.
+"""
+
+# Maximum width of preview images sent to the browser
+_PREVIEW_MAX_WIDTH = 640
+
+# JPEG quality used for frames sent to the browser
+_FEED_JPEG_QUALITY = 80
+
+# Seconds between reconnect attempts made by the live feed thread
+_FEED_RECONNECT_INTERVAL = 5.0
+
+# The feed thread exits once its session has not drained the queue for this many seconds;
+# well above the ~1 minute timer throttling browsers apply to background tabs
+_FEED_IDLE_TIMEOUT = 300.0
+
+# Minimum seconds between camera reads for the ROI preview
+_ROI_PREVIEW_TTL = 2.0
+
+# Seconds a camera grid status snapshot is reused within a session
+_GRID_STATUS_TTL = 1.0
+
+# Process-wide preview frame ids, so overlay cache keys never collide across sessions
+_PREVIEW_FRAME_IDS = itertools.count(1)
+
+# Colors used for the visibility status badge
+_VIS_COLOR = {"Good": "green", "Moderate": "orange", "Poor": "red"}
+
+# Single worker so database maintenance never runs twice at once or on the script thread
+_DB_MAINTENANCE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-maintenance")
+
+# Fallback weather icons by condition name
+_CONDITION_EMOJI = {
+    "Clear": "☀️",
+    "Clouds": "☁️",
+    "Rain": "🌧️",
+    "Drizzle": "🌦️",
+    "Thunderstorm": "⛈️",
+    "Snow": "❄️",
+    "Mist": "🌫️",
+    "Fog": "🌫️"
+}
+
+# How each weather factor affects visibility, shown on the weather tab
+_IMPACT_DATA = (
+    ('Temperature', 'Medium impact - High temperatures can create heat haze'),
+    ('Humidity', 'High impact - Higher humidity generally reduces visibility'),
+    ('Precipitation', 'Very high impact - Rain and snow drastically reduce visibility'),
+    ('Wind', 'Variable impact - Can clear fog but also bring dust and particles'),
+    ('Fog/Mist', 'Extreme impact - Fog is the primary visibility reducer')
+)
+
+# Current system metric cards per column: (label, metric key, format, delta color)
+_CURRENT_METRICS_SPEC = (
+    (("CPU Usage", "cpu_usage", "{:.1f}%", "inverse"),
+     ("Active Cameras", "camera_count", "{}", "normal"),
+     ("Errors (24h)", "error_count", "{}", "inverse")),
+    (("Memory Usage", "memory_gb", "{:.2f} GB", "inverse"),
+     ("Active ROIs", "active_rois", "{}", "normal"),
+     ("Connection Failures (24h)", "connection_failures", "{}", "inverse")),
+    (("Disk Usage", "disk_usage", "{:.1f}%", "inverse"),
+     ("Processing Time", "processing_time", "{:.2f} ms", "inverse"),
+     ("Network Speed", "network_speed", "{:.2f} Mbps", "normal"))
+)
+
+# Shared generator for the mock data (PCG64, draws whole arrays in C)
+_RNG = np.random.default_rng()
+
+# Column formats for the dashboard camera status summary
+_CAMERA_SUMMARY_COLUMNS = {"Visibility": st.column_config.NumberColumn("Visibility", format="%.1f%%")}
+
+# Column formats for the recordings table; values stay numeric/datetime for Arrow
+_RECORDING_COLUMNS = {
+    "mtime": st.column_config.DatetimeColumn("Date", format="YYYY-MM-DD HH:mm:ss"),
+    "size_mb": st.column_config.NumberColumn("Size", format="%.2f MB")
+}
+
+# Mock dashboard data for demonstration
+_EVENT_COLUMNS = ("timestamp", "camera", "type", "details")
+_MOCK_EVENTS = (
+    ("2023-04-30 14:23:45", "Front Gate", "Visibility Decrease", "Visibility dropped to 45%"),
+    ("2023-04-30 12:15:30", "Back Yard", "Camera Disconnected", "Connection lost"),
+    ("2023-04-30 10:05:12", "Driveway", "Visibility Increase", "Visibility improved to 92%"),
+    ("2023-04-30 08:45:22", "Front Gate", "Weather Change", "Rain detected")
+)
+_MOCK_ALERTS = (
+    {"severity": "High", "message": "Camera 'Back Yard' disconnected for more than 30 minutes", "time": "14:45:22"},
+    {"severity": "Medium", "message": "Disk usage above 70%", "time": "13:30:15"}
+)
+_MOCK_HIGHLIGHTS = (
+    {
+        'id': '1',
+        'date': '2023-04-30 14:23:45',
+        'type': 'Visibility Decrease',
+        'description': 'Visibility dropped from 85% to 45%',
+        'duration': '00:30',
+        'thumbnail': 'https://via.placeholder.com/320x240.png?text=Visibility+Decrease',
+        'video_path': ''
+    },
+    {
+        'id': '2',
+        'date': '2023-04-29 12:15:30',
+        'type': 'Weather Change',
+        'description': 'Rain detected, visibility affected',
+        'duration': '00:45',
+        'thumbnail': 'https://via.placeholder.com/320x240.png?text=Weather+Change',
+        'video_path': ''
+    },
+    {
+        'id': '3',
+        'date': '2023-04-28 10:05:12',
+        'type': 'Visibility Increase',
+        'description': 'Visibility improved from 40% to 92%',
+        'duration': '00:20',
+        'thumbnail': 'https://via.placeholder.com/320x240.png?text=Visibility+Increase',
+        'video_path': ''
+    }
+)
+
+# Historical tab sampling: every 2 hours, daily at midnight, or weekly on Mondays
+_INTERVAL_FREQ = {"Hourly": "2h", "Daily": "D", "Weekly": "W-MON"}
+
+# Performance history periods, in hours
+_TIME_OPTIONS = {
+    "Last 6 Hours": 6,
+    "Last 12 Hours": 12,
+    "Last 24 Hours": 24,
+    "Last 3 Days": 72,
+    "Last 7 Days": 168
+}
+
+_RESOLUTION_OPTIONS = ("320x240 (QVGA)", "640x480 (VGA)", "800x600 (SVGA)",
+                       "1280x720 (HD)", "1920x1080 (Full HD)")
+
+# Tables listed in the Database Statistics expander
+_DB_TABLES = ("visibility_metrics", "daily_stats", "weather_data", "events", "performance_metrics")
+
+# Approximate row counts from ANALYZE; the first stat field is the table's row count
+_DB_STAT_COUNTS_SQL = (
+    "SELECT tbl, MAX(CAST(stat AS INTEGER)) FROM sqlite_stat1 "
+    f"WHERE tbl IN ({', '.join('?' * len(_DB_TABLES))}) GROUP BY tbl"
+)
+
+# Most points sent to the browser per performance history trace
+_PLOT_MAX_POINTS = 2000
+
+# Most points per historical metric trace; the plot shows trends, not every sample
+_HISTORY_MAX_POINTS = 1000
+
+
+def _feed_frame_html(jpeg_bytes, timestamp):
+    """Return the live feed markup: the JPEG frame with the timestamp overlaid by CSS"""
+    b64 = base64.b64encode(jpeg_bytes).decode('ascii')
+    return (f'{_FEED_FRAME_CSS}<div class="feed-frame"><img src="data:image/jpeg;base64,{b64}"/>'
+            f'<div class="ts-overlay">{timestamp}</div></div>')
+
+
+@st.cache_resource(ttl=_ROI_PREVIEW_TTL, show_spinner=False)
+def _get_preview_frame(camera_id, _camera_manager):
+    """Return the latest frame for a camera at preview size, read at most once per _ROI_PREVIEW_TTL seconds"""
+    frame = _camera_manager.read_latest_nowait()
+    if frame is None:
+        return None
+    
+    # Downscale to display size once so drawing and encoding touch fewer pixels
+    h, w = frame.shape[:2]
+    if w > _PREVIEW_MAX_WIDTH:
+        frame = cv2.resize(frame, (_PREVIEW_MAX_WIDTH, int(_PREVIEW_MAX_WIDTH * h / w)),
+                           interpolation=cv2.INTER_AREA)
+    return frame
+
+
+def _roi_tuples(roi_regions):
+    """Return the hashable (name, x, y, width, height) tuples used to draw ROI overlays"""
+    return tuple((r["name"], r["x"], r["y"], r["width"], r["height"]) for r in roi_regions)
+
+
+@lru_cache(maxsize=16)
+def _roi_overlay_layer(shape, rois, highlight_idx=None, draft=None):
+    """Return the ROI boxes and labels drawn once on black for a frame shape, plus the inverse coverage"""
+    layer = np.zeros(shape, dtype=np.uint8)
+    h, w = shape[:2]
+    
+    # Scale all ROI boxes to pixels in one step
+    coords = np.array([roi[1:] for roi in rois], dtype=np.float64).reshape(-1, 4)
+    coords = (coords * (w, h, w, h)).astype(np.int32)
+    
+    # Existing ROIs in green, the selected one in red (BGR order)
+    for i, (x, y, width, height) in enumerate(coords.tolist()):
+        color = (0, 0, 255) if i == highlight_idx else (0, 255, 0)
+        cv2.rectangle(layer, (x, y), (x + width, y + height), color, 2)
+        cv2.putText(layer, rois[i][0], (x+5, y+20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 2)
+    
+    # ROI being edited in blue
+    if draft is not None:
+        name, x, y, width, height = draft
+        x, y = int(x * w), int(y * h)
+        cv2.rectangle(layer, (x, y), (x + int(width * w), y + int(height * h)), (255, 0, 0), 2)
+        cv2.putText(layer, name, (x+5, y+20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 0), 2)
+    
+    # Every overlay color has a full 255 channel, so the brightest channel is the drawing coverage
+    inv_coverage = 255 - layer.max(axis=2, keepdims=True).astype(np.uint16)
+    
+    # Cached arrays are shared between reruns, so make them read-only
+    layer.setflags(write=False)
+    inv_coverage.setflags(write=False)
+    return layer, inv_coverage
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _render_roi_overlay(frame_key, _preview_bgr, rois, highlight_idx=None, draft=None):
+    """Return the BGR preview with ROI boxes drawn as JPEG bytes, cached on frame_key and the ROI tuples"""
+    # Nothing to draw, so skip the overlay layer and blend entirely
+    if not rois and draft is None:
+        return UIComponents.encode_feed_frame(_preview_bgr)
+    
+    # Blend the pre-drawn overlay onto the frame the way OpenCV would draw it
+    layer, inv_coverage = _roi_overlay_layer(_preview_bgr.shape, rois, highlight_idx, draft)
+    preview_img = (_preview_bgr * inv_coverage // 255).astype(np.uint8)
+    preview_img += layer
+    
+    # Encode straight from BGR; st.image passes JPEG bytes through untouched
+    return UIComponents.encode_feed_frame(preview_img)
+
+
+def _lttb(x, y, n_out=_PLOT_MAX_POINTS):
+    """Downsample a series to n_out points with Largest-Triangle-Three-Buckets, keeping its visual shape"""
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return x, y
+    
+    # Work on float copies; timestamps become seconds since the epoch
+    xs = x.astype('datetime64[s]').astype(np.float64) if np.issubdtype(x.dtype, np.datetime64) else x.astype(np.float64)
+    ys = y.astype(np.float64)
+    
+    # The first and last points are always kept; the rest are split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x, avg_y = xs[end:next_end].mean(), ys[end:next_end].mean()
+        
+        # Keep the point forming the largest triangle with the last kept point and the next bucket's average
+        area = np.abs((xs[a] - avg_x) * (ys[start:end] - ys[a]) - (xs[a] - xs[start:end]) * (avg_y - ys[a]))
+        a = start + int(area.argmax())
+        idx[i + 1] = a
+    return x[idx], y[idx]
+
+
+@st.cache_data(ttl=60, max_entries=8, show_spinner=False)
+def _load_metrics(hours, monitor_id, _system_monitor):
+    """Fetch the metrics history as column arrays, cached per period and monitor for one collection interval"""
+    # Per-minute buckets up to a day, hourly beyond (a week is 168 points)
+    bucket = 'minute' if hours <= 24 else 'hour'
+    return _system_monitor.get_metrics_history(hours=hours, layout='soa', bucket=bucket)
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _build_performance_fig(hours, n_rows, last_row, _metrics):
+    """Build the system performance history figure, reused while the period and latest bucket are unchanged"""
+    # Create subplots
+    fig = make_subplots(
+        rows=3, cols=1,
+        subplot_titles=("CPU & Memory Usage", "Processing Performance", "System Status"),
+        shared_xaxes=True,
+        vertical_spacing=0.1
+    )
+    
+    # Downsample every series before it is serialised for the browser
+    ts = _metrics['timestamp']
+    cpu_x, cpu_y = _lttb(ts, _metrics['cpu_usage'])
+    mem_x, mem_y = _lttb(ts, _metrics['memory_usage'] * (1.0 / 1024.0))  # Convert to GB
+    frames_x, frames_y = _lttb(ts, _metrics['frames_processed'])
+    proc_x, proc_y = _lttb(ts, _metrics['processing_time'])
+    cams_x, cams_y = _lttb(ts, _metrics['camera_count'])
+    errors_x, errors_y = _lttb(ts, _metrics['error_count'])
+
+    # Plot CPU and Memory usage (WebGL, these are the densest series)
+    fig.add_trace(
+        go.Scattergl(
+            x=cpu_x,
+            y=cpu_y,
+            mode='lines',
+            name='CPU Usage (%)',
+            line=dict(color='#1f77b4')
+        ),
+        row=1, col=1
+    )
+
+    fig.add_trace(
+        go.Scattergl(
+            x=mem_x,
+            y=mem_y,
+            mode='lines',
+            name='Memory Usage (GB)',
+            line=dict(color='#ff7f0e'),
+            yaxis='y2'
+        ),
+        row=1, col=1
+    )
+
+    # Processing performance
+    fig.add_trace(
+        go.Scatter(
+            x=frames_x,
+            y=frames_y,
+            mode='lines+markers',
+            name='Frames Processed',
+            line=dict(color='#2ca02c')
+        ),
+        row=2, col=1
+    )
+
+    fig.add_trace(
+        go.Scatter(
+            x=proc_x,
+            y=proc_y,
+            mode='lines',
+            name='Processing Time (ms)',
+            line=dict(color='#d62728'),
+            yaxis='y3'
+        ),
+        row=2, col=1
+    )
+
+    # System status
+    fig.add_trace(
+        go.Scatter(
+            x=cams_x,
+            y=cams_y,
+            mode='lines+markers',
+            name='Active Cameras',
+            line=dict(color='#9467bd')
+        ),
+        row=3, col=1
+    )
+
+    fig.add_trace(
+        go.Scatter(
+            x=errors_x,
+            y=errors_y,
+            mode='lines+markers',
+            name='Errors',
+            line=dict(color='#e377c2'),
+            yaxis='y4'
+        ),
+        row=3, col=1
+    )
+
+    # Update layout
+    fig.update_layout(
+        height=800,
+        title_text="System Performance Metrics",
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        ),
+        yaxis=dict(title="CPU Usage (%)"),
+        yaxis2=dict(
+            title="Memory (GB)",
+            overlaying="y",
+            side="right"
+        ),
+        yaxis3=dict(
+            title="Processing Time (ms)",
+            overlaying="y",
+            side="right"
+        ),
+        yaxis4=dict(
+            title="Error Count",
+            overlaying="y",
+            side="right"
+        )
+    )
+    
+    return fig
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _mock_historical_df(start_date, end_date, interval):
+    """Return mock historical metrics for a date range, built once per range and interval"""
+    # Generate date range, covering the whole of end_date
+    date_range = pd.date_range(datetime.combine(start_date, datetime.min.time()),
+                               datetime.combine(end_date, datetime.max.time()),
+                               freq=_INTERVAL_FREQ[interval])
+
+    # Generate all rows at once
+    ts = date_range.values.astype('datetime64[s]')
+    n = len(ts)
+
+    base_visibility = 80
+    base_brightness = 150
+    base_contrast = 60
+    base_edge = 70
+
+    # Add some randomness and trends
+    time_factor = (ts - np.datetime64(start_date, 's')).astype(np.float64) / (24 * 3600)
+    daily_cycle = np.sin(time_factor * np.pi / 12) * 20  # Daily cycle
+
+    # Create some events: 10% chance, more likely to be negative
+    event_impact = np.where(_RNG.random(n) < 0.1, np.where(_RNG.random(n) < 0.7, -40, 20), 0)
+
+    visibility = np.clip(base_visibility + daily_cycle + event_impact + _RNG.uniform(-10, 10, n), 0, 100)
+    brightness = np.clip(base_brightness + daily_cycle + event_impact + _RNG.uniform(-20, 20, n), 0, 255)
+    contrast = np.clip(base_contrast + daily_cycle/3 + event_impact/2 + _RNG.uniform(-5, 5, n), 0, 100)
+    edge = np.clip(base_edge + daily_cycle/3 + event_impact/2 + _RNG.uniform(-10, 10, n), 0, 100)
+
+    # Weather correlation is stronger during events
+    weather_corr = np.minimum(1.0, np.abs(event_impact) / 20 + _RNG.uniform(0, 0.7, n))
+
+    # Convert to DataFrame with explicit dtypes; float32 halves the Arrow and plot payloads
+    df = pd.DataFrame.from_dict({
+        'timestamp': pd.DatetimeIndex(ts),
+        'visibility': visibility.astype(np.float32),
+        'brightness': brightness.astype(np.float32),
+        'contrast': contrast.astype(np.float32),
+        'edge': edge.astype(np.float32),
+        'weather_correlation': weather_corr.astype(np.float32)
+    }, orient='columns')
+    
+    return df
+
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _synth_vis_df(hour_bucket, hours=24):
+    """Return placeholder hourly visibility metrics indexed by timestamp, rebuilt once per hour_bucket"""
+    return pd.DataFrame({
+        "visibility_score": _RNG.integers(50, 100, hours, endpoint=True),
+        "brightness": _RNG.integers(100, 200, hours, endpoint=True),
+        "contrast": _RNG.integers(30, 90, hours, endpoint=True),
+        "edge_score": _RNG.integers(40, 80, hours, endpoint=True)
+    }, index=pd.date_range(start="2023-04-01", periods=hours, freq="h", name="timestamp"))
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_icon(url):
+    """Download a weather icon once an hour so reruns render it from memory"""
+    response = requests.get(url, timeout=2)
+    response.raise_for_status()
+    return response.content
+
+
+@st.cache_data(ttl=300, max_entries=4, show_spinner=False)
+def _weather_hist_series(hist_tuple):
+    """Return the temperature history as a Series indexed by timestamp, cached on the (timestamp, temperature) pairs"""
+    timestamps, temperatures = zip(*hist_tuple)
+    return pd.Series(temperatures, index=pd.to_datetime(list(timestamps)), name='temperature')
+
+
+@st.cache_data(ttl=300, max_entries=4, show_spinner=False)
+def _weather_hist_table(historical):
+    """Return the raw weather history records as a DataFrame"""
+    return pd.DataFrame(historical)
+
+
+def _collect_statuses(cam_names, camera_managers):
+    """Return {camera name: status dict} for the grid, fetched once per second at most per session"""
+    # Managers live in each session, so the snapshot is memoized there rather than in a shared cache
+    now = time.time()
+    cached = st.session_state.get('_grid_statuses')
+    if cached is not None and cached[0] == cam_names and now - cached[1] < _GRID_STATUS_TTL:
+        return cached[2]
+    
+    statuses = {}
+    for cam_name in cam_names:
+        get_status = getattr(camera_managers[cam_name], 'get_status', None)
+        statuses[cam_name] = get_status() if get_status else {}
+    st.session_state._grid_statuses = (cam_names, now, statuses)
+    return statuses
+
+
+@st.cache_resource(show_spinner=False)
+def _placeholder_png(text):
+    """Render a grey 640x480 placeholder with centred text as PNG bytes, once per text"""
+    img = np.full((480, 640, 3), 204, dtype=np.uint8)
+    (w, h), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 1.2, 2)
+    cv2.putText(img, text, ((640 - w) // 2, (480 + h) // 2), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (85, 85, 85), 2)
+    ok, buf = cv2.imencode('.png', img)
+    if not ok:
+        raise ValueError("Failed to encode placeholder")
+    return buf.tobytes()
+
+
+@lru_cache(maxsize=4)
+def _placeholder_data_uri(text):
+    """Return the placeholder PNG as a base64 data URI for inline HTML"""
+    return "data:image/png;base64," + base64.b64encode(_placeholder_png(text)).decode("ascii")
+
+
+def _grid_cell_html(cam_name, status):
+    """Return one camera grid cell: name, connection state, thumbnail and summary metrics"""
+    name = html.escape(cam_name)
+    if status.get('connected', False):
+        # In an actual app, this would show a real camera frame
+        state = '<div class="cam-state" style="color: green;">Connected</div>'
+        thumb = _placeholder_data_uri("Camera Feed")
+        metrics = (f'<div class="cam-metrics"><span>Visibility: {status.get("visibility_score", "N/A")}%</span>'
+                   f'<span>Status: {html.escape(str(status.get("visibility_status", "Unknown")))}</span></div>')
+    else:
+        state = '<div class="cam-state" style="color: red;">Disconnected</div>'
+        thumb = _placeholder_data_uri("Camera Disconnected")
+        metrics = ''
+    return (f'<div class="camera-cell"><strong>{name}</strong>{state}'
+            f'<figure><img src="{thumb}"><figcaption>Camera: {name}</figcaption></figure>{metrics}</div>')
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _events_df(rows):
+    """Return the recent events table for a tuple of event rows"""
+    return pd.DataFrame(list(rows), columns=_EVENT_COLUMNS)
+
+
+@st.cache_data(ttl=60, max_entries=16, show_spinner=False)
+def _load_highlights(camera_name):
+    """Return the highlight events for a camera, with each date parsed once into 'timestamp'"""
+    # In a real app, these would be loaded from storage or database
+    return [{**h, 'timestamp': datetime.strptime(h['date'], '%Y-%m-%d %H:%M:%S')} for h in _MOCK_HIGHLIGHTS]
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _filter_highlights(rows, start_dt, end_dt, event_type):
+    """Return the highlights of event_type (or all) that fall between start_dt and end_dt"""
+    return [h for h in rows
+            if (event_type == "All Events" or h['type'] == event_type)
+            and start_dt <= h['timestamp'] <= end_dt]
+
+
+def _highlight_grid_html(highlights):
+    """Return the highlight thumbnails, types, dates and descriptions as one 3-column HTML grid"""
+    cells = ''.join(
+        f'<div class="camera-cell"><figure><img src="{html.escape(h["thumbnail"])}"></figure>'
+        f'<strong>{html.escape(h["type"])}</strong><figcaption>{html.escape(h["date"])}</figcaption>'
+        f'<p>{html.escape(h["description"])}</p></div>'
+        for h in highlights
+    )
+    return (f'{_CAMERA_GRID_CSS}<div class="camera-grid" '
+            f'style="grid-template-columns: repeat(3, 1fr);">{cells}</div>')
+
+
+def _delete_selected_highlight(date):
+    """Clear the highlight selection and leave a notice for the next rerun"""
+    # In a real app, this would delete the highlight
+    st.session_state.selected_highlight_id = None
+    st.session_state.highlight_notice = f"Deleted highlight from {date}"
+
+
+@lru_cache(maxsize=64)
+def _ensure_dir(base, name):
+    """Return base/name, creating it on the first call for that pair"""
+    path = os.path.join(base, name)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+@lru_cache(maxsize=64)
+def _fmt_uptime(seconds):
+    """Format an uptime in seconds as days, hours and minutes"""
+    days, remainder = divmod(seconds, 86400)
+    hours, remainder = divmod(remainder, 3600)
+    minutes, _ = divmod(remainder, 60)
+    return f"{days}d {hours}h {minutes}m"
+
+
+@lru_cache(maxsize=8)
+def _vis_badge(status):
+    """Return the HTML badge markup for a visibility status"""
+    color = _VIS_COLOR.get(status, "gray")
+    return f"<p style='color: {color}; font-weight: bold;'>Status: {status}</p>"
+
+
+def _setting_key(group, field, default):
+    """Seed the widget key for a nested sidebar setting from its settings dict"""
+    key = f"{group}_{field}"
+    if key not in st.session_state:
+        st.session_state[key] = st.session_state[group].get(field, default)
+    return key
+
+
+def _sync_setting(group, field):
+    """on_change callback copying a sidebar widget value back into its settings dict"""
+    st.session_state[group][field] = st.session_state[f"{group}_{field}"]
+
+
+def _bound(group, field, default):
+    """Widget kwargs binding a sidebar widget to st.session_state[group][field]"""
+    return {
+        "key": _setting_key(group, field, default),
+        "on_change": _sync_setting,
+        "args": (group, field),
+    }
+
 class UIComponents:
     @staticmethod
     def setup_page_config():
@@ -33,183 +857,7 @@ class UIComponents:
     @staticmethod
     def setup_css():
         """Setup custom CSS styles"""
-        st.markdown("""
-        <style>
-            /* Main theme colors */
-            :root {
-                --primary-color: #1E88E5;
-                --secondary-color: #0D47A1;
-                --background-color: transparent;
-                --card-background: transparent;
-                --text-color: #212121;
-                --border-color: #e0e0e0;
-            }
-            
-            /* Override Streamlit's base container */
-            .stApp {
-                background-color: transparent !important;
-            }
-            
-            .element-container, div.block-container {
-                background-color: transparent !important;
-            }
-            
-            /* Main container */
-            .main {
-                background-color: transparent !important;
-            }
-            
-            /* Header styles */
-            .main-header {
-                font-size: 2.5rem;
-                margin-bottom: 1rem;
-                color: var(--primary-color);
-                text-align: center;
-                font-weight: 600;
-                background-color: transparent !important;
-            }
-            
-            /* Sub-header styles */
-            .sub-header {
-                font-size: 1.5rem;
-                margin-top: 1rem;
-                margin-bottom: 0.5rem;
-                color: var(--secondary-color);
-                font-weight: 500;
-                background-color: transparent !important;
-            }
-            
-            /* Card styles */
-            .card {
-                background-color: transparent !important;
-                border-radius: 10px;
-                padding: 20px;
-                margin-bottom: 20px;
-            }
-            
-            /* Status indicators */
-            .indicator {
-                font-size: 1.2rem;
-                font-weight: 500;
-                display: inline-block;
-                padding: 8px 16px;
-                border-radius: 5px;
-                margin: 4px;
-            }
-            
-            .good-visibility {
-                background-color: #e8f5e9;
-                color: #2e7d32;
-                border: 1px solid #a5d6a7;
-            }
-            
-            .poor-visibility {
-                background-color: #ffebee;
-                color: #c62828;
-                border: 1px solid #ef9a9a;
-            }
-            
-            /* Camera selector */
-            .camera-selector {
-                background-color: transparent !important;
-                border-radius: 10px;
-                padding: 15px;
-                margin-bottom: 20px;
-            }
-            
-            /* Button styles */
-            .stButton button {
-                background-color: var(--primary-color);
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 16px;
-                font-weight: 500;
-                transition: background-color 0.3s;
-            }
-            
-            .stButton button:hover {
-                background-color: var(--secondary-color);
-            }
-            
-            /* Input styles */
-            .stTextInput input, .stNumberInput input, .stSelectbox select {
-                border: 1px solid var(--border-color);
-                border-radius: 5px;
-                padding: 8px;
-                background-color: transparent !important;
-            }
-            
-            /* Metric styles */
-            .stMetric {
-                background-color: transparent !important;
-                border-radius: 5px;
-                padding: 10px;
-                margin: 5px;
-            }
-            
-            /* Tab styles */
-            .stTabs [data-baseweb="tab-list"] {
-                gap: 2px;
-                background-color: transparent !important;
-            }
-            
-            .stTabs [data-baseweb="tab"] {
-                background-color: transparent !important;
-                border-radius: 5px 5px 0 0;
-                padding: 10px 20px;
-            }
-            
-            .stTabs [data-baseweb="tab-panel"] {
-                background-color: transparent !important;
-            }
-
-            /* Override Streamlit's default backgrounds */
-            div[data-testid="stMetricValue"],
-            div[data-testid="stMetricDelta"],
-            div[data-testid="stMetricLabel"],
-            div[data-testid="stVerticalBlock"],
-            div[data-testid="stHorizontalBlock"],
-            div[data-testid="stMarkdown"],
-            div[class^="st-"],
-            section[data-testid="stSidebar"],
-            div[class="stPlotlyChart"] {
-                background-color: transparent !important;
-            }
-
-            /* Make plotly charts background transparent */
-            .js-plotly-plot .plotly .main-svg,
-            .js-plotly-plot .plotly .modebar {
-                background: transparent !important;
-            }
-            
-            /* Override any white backgrounds */
-            div {
-                background-color: transparent !important;
-            }
-            
-            /* Ensure text remains visible */
-            .stMarkdown, .stText {
-                color: var(--text-color) !important;
-            }
-            
-            /* Style the tab content area */
-            .stTabContent {
-                background-color: transparent !important;
-                padding: 1rem 0;
-            }
-            
-            /* Style the sidebar */
-            section[data-testid="stSidebar"] > div {
-                background-color: transparent !important;
-            }
-            
-            /* Style all containers */
-            .stContainer, .element-container {
-                background-color: transparent !important;
-            }
-        </style>
-        """, unsafe_allow_html=True)
+        st.markdown(_APP_CSS, unsafe_allow_html=True)
     
     @staticmethod
     def create_sidebar(cameras, selected_camera, on_camera_change):
@@ -218,14 +866,14 @@ class UIComponents:
         
         # Camera selection dropdown
         st.sidebar.subheader("Camera Selection")
-        camera_names = {cam_id: config['name'] for cam_id, config in cameras.items()}
+        camera_ids = list(cameras)
         
         # Use URL parameter as a safe way to change camera
         selected = st.sidebar.selectbox(
             "Select Camera",
-            options=list(cameras.keys()),
-            format_func=lambda x: camera_names.get(x, x),
-            index=list(cameras.keys()).index(selected_camera) if selected_camera in cameras else 0,
+            options=camera_ids,
+            format_func=lambda x: cameras[x]['name'] if x in cameras else x,
+            index=camera_ids.index(selected_camera) if selected_camera in cameras else 0,
             key="camera_selector"
         )
         
@@ -246,16 +894,12 @@ class UIComponents:
             except Exception as e:
                 st.sidebar.error(f"Error reconnecting: {str(e)}")
         
-        # Create sidebar sections
-        st.sidebar.markdown("---")
+        # Create sidebar sections; separators are drawn by _SIDEBAR_CSS
+        st.sidebar.markdown(_SIDEBAR_CSS, unsafe_allow_html=True)
         UIComponents._create_stream_settings_section()
-        st.sidebar.markdown("---")
         UIComponents._create_display_settings_section()
-        st.sidebar.markdown("---")
         UIComponents._create_analytics_settings_section()
-        st.sidebar.markdown("---")
         UIComponents._create_weather_settings_section()
-        st.sidebar.markdown("---")
         # Add performance monitoring settings
         if 'system_monitor' in st.session_state and st.session_state.system_monitor:
             UIComponents._create_performance_monitoring_settings_section()
@@ -263,283 +907,374 @@ class UIComponents:
         return selected
     
     @staticmethod
-    def create_main_content(camera_config, camera_status, weather_data, feed_container):
+    def create_main_content(camera_config, camera_status, weather_data):
         """Create the main content with tabs"""
         # Create tabs for different sections
-        tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9, tab10 = st.tabs([
-            "📡 Live Monitoring",
-            "📊 Analytics",
-            "🌦️ Weather Insights",
-            "🔍 ROI Configuration",
-            "📼 Recordings",
-            "🔍 Highlights",
-            "📆 Historical Data",
-            "📹 Camera Grid",
-            "📋 Dashboard Overview",
-            "⚙️ Performance"
-        ])
+        try:
+            # Track the selected tab so hidden tabs can skip rendering
+            tabs = st.tabs(_TAB_LABELS, key="main_tabs", on_change="rerun")
+        except TypeError:
+            # Older Streamlit versions don't track tabs; every tab renders
+            tabs = st.tabs(_TAB_LABELS)
+        tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9, tab10 = tabs
         
         # Check if camera status is available
         camera_connected = camera_status.get('connected', False) if camera_status else False
         
-        # Live monitoring tab
+        # Each tab body is a fragment so its widgets only rerun that tab; Live Monitoring
+        # and Camera Grid instead hold their own timed fragments.
+        # Tabs other than Live Monitoring render once they have been opened.
         with tab1:
-            col1, col2, col3 = st.columns([1, 1, 1])
-            with col1:
-                if st.button("Refresh Feed", key="ui_refresh_feed_btn"):
-                    st.rerun()
-            with col2:
-                if st.button("Reconnect Camera", key="ui_reconnect_camera_btn"):
-                    st.session_state.camera_connected = False
-                    st.rerun()
-            with col3:
-                if st.button("Stop" if st.session_state.streaming else "Start", key="ui_stream_control_btn"):
-                    st.session_state.streaming = not st.session_state.streaming
-                    st.rerun()
-            
-            # Display camera feed placeholder or error message
-            st.markdown("### Live Feed")
-            if camera_connected:
-                feed_container
-            else:
-                st.error("Camera is not connected. Please check your camera connection or settings.")
-                if st.button("Try Reconnect", key="try_reconnect_btn"):
-                    st.session_state.camera_connected = False
-                    st.rerun()
-
-            # Display weather metrics if available
-            if weather_data:
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.metric("Temperature", f"{weather_data.get('temperature', 'N/A')}°C")
-                    st.metric("Humidity", f"{weather_data.get('humidity', 'N/A')}%")
-                with col2:
-                    st.metric("Visibility", f"{weather_data.get('visibility', 'N/A')} km")
-                    st.metric("Condition", weather_data.get('condition', 'N/A'))
-            else:
-                st.warning("Weather data is not available. Please check your weather API settings.")
+            UIComponents.create_live_monitoring_tab(camera_connected, weather_data)
         
-        # Analytics tab
         with tab2:
-            if 'selected_camera' in st.session_state:
-                # Pass the camera manager object instead of camera_data
-                camera_manager = st.session_state.camera_managers[st.session_state.selected_camera]
-                UIComponents.create_analytics_tab(camera_manager)
-            else:
-                st.info("No analytics data available yet. This section will update once data is collected.")
+            if UIComponents._tab_visible(tab2, "tab2"):
+                UIComponents._analytics_tab_fragment()
         
-        # Weather tab
         with tab3:
-            UIComponents.create_weather_tab(weather_data)
+            if UIComponents._tab_visible(tab3, "tab3"):
+                UIComponents._weather_tab_fragment(weather_data)
         
-        # ROI Configuration tab
         with tab4:
-            if 'selected_camera' in st.session_state:
-                camera_config = st.session_state.cameras[st.session_state.selected_camera]
-                camera_manager = st.session_state.camera_managers[st.session_state.selected_camera]
-                threshold_changes = UIComponents._create_roi_config_tab(camera_config, camera_manager)
-                if threshold_changes is not None:
-                    # Update camera config with new threshold values
-                    for key, value in threshold_changes.items():
-                        camera_config[key] = value
-            else:
-                st.info("Please select a camera to configure ROIs.")
+            if UIComponents._tab_visible(tab4, "tab4"):
+                UIComponents._roi_tab_fragment()
         
-        # Recordings tab
         with tab5:
-            if 'selected_camera' in st.session_state:
-                # Pass the camera manager object instead of just the camera ID
-                camera_manager = st.session_state.camera_managers[st.session_state.selected_camera]
-                UIComponents.create_recordings_tab(camera_manager)
-            else:
-                st.info("No recordings available. Please select a camera.")
+            if UIComponents._tab_visible(tab5, "tab5"):
+                UIComponents._recordings_tab_fragment()
         
-        # Highlights tab
         with tab6:
-            if 'selected_camera' in st.session_state:
-                # Pass the camera manager object instead of just the camera ID
-                camera_manager = st.session_state.camera_managers[st.session_state.selected_camera]
-                UIComponents.create_highlights_tab(camera_manager)
-            else:
-                st.info("No highlights available. Please select a camera.")
+            if UIComponents._tab_visible(tab6, "tab6"):
+                UIComponents._highlights_tab_fragment()
         
-        # Historical data tab
         with tab7:
-            if 'selected_camera' in st.session_state:
-                # Pass the camera manager object instead of just the camera ID
-                camera_manager = st.session_state.camera_managers[st.session_state.selected_camera]
-                UIComponents.create_historical_tab(camera_manager)
-            else:
-                st.info("No historical data available. Please select a camera.")
+            if UIComponents._tab_visible(tab7, "tab7"):
+                UIComponents._historical_tab_fragment()
         
-        # Camera Grid tab
+        # The grid tab holds its own fragments (a timed grid and the controls), not one around the tab
         with tab8:
-            UIComponents.create_camera_grid_tab()
+            if UIComponents._tab_visible(tab8, "tab8"):
+                UIComponents.create_camera_grid_tab()
             
-        # Dashboard Overview tab
+        # Dashboard Overview tab (already a fragment)
         with tab9:
-            UIComponents.create_dashboard_overview()
+            if UIComponents._tab_visible(tab9, "tab9"):
+                UIComponents.create_dashboard_overview()
             
-        # Performance tab
         with tab10:
-            if 'system_monitor' in st.session_state and st.session_state.system_monitor:
-                UIComponents.create_performance_monitoring_tab(st.session_state.system_monitor)
-            else:
-                st.info("System performance monitoring is not available. Please check your installation.")
+            if UIComponents._tab_visible(tab10, "tab10"):
+                UIComponents._performance_tab_fragment()
             
         return (tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9, tab10)
 
     @staticmethod
-    def update_feed(feed_container, camera_manager, message_queue):
+    def _tab_visible(tab, name):
+        """Return True if a tab is selected or has been rendered before"""
+        is_open = getattr(tab, 'open', None)
+        if is_open is None:
+            # Tab state isn't tracked, so render everything
+            return True
+        if is_open:
+            st.session_state[f'{name}_rendered'] = True
+            return True
+        return st.session_state.get(f'{name}_rendered', False)
+    
+    @staticmethod
+    @st.fragment
+    def _analytics_tab_fragment():
+        """Analytics tab body"""
+        if 'selected_camera' in st.session_state:
+            # Pass the camera manager object instead of camera_data
+            camera_manager = st.session_state.camera_managers[st.session_state.selected_camera]
+            UIComponents.create_analytics_tab(camera_manager)
+        else:
+            st.info("No analytics data available yet. This section will update once data is collected.")
+    
+    @staticmethod
+    @st.fragment
+    def _weather_tab_fragment(weather_data):
+        """Weather tab body"""
+        UIComponents.create_weather_tab(weather_data)
+    
+    @staticmethod
+    @st.fragment
+    def _roi_tab_fragment():
+        """ROI configuration tab body"""
+        if 'selected_camera' in st.session_state:
+            camera_config = st.session_state.cameras[st.session_state.selected_camera]
+            camera_manager = st.session_state.camera_managers[st.session_state.selected_camera]
+            threshold_changes = UIComponents._create_roi_config_tab(camera_config, camera_manager)
+            if threshold_changes is not None:
+                # Update camera config with new threshold values
+                for key, value in threshold_changes.items():
+                    camera_config[key] = value
+        else:
+            st.info("Please select a camera to configure ROIs.")
+    
+    @staticmethod
+    @st.fragment
+    def _recordings_tab_fragment():
+        """Recordings tab body"""
+        if 'selected_camera' in st.session_state:
+            # Pass the camera manager object instead of just the camera ID
+            camera_manager = st.session_state.camera_managers[st.session_state.selected_camera]
+            UIComponents.create_recordings_tab(camera_manager)
+        else:
+            st.info("No recordings available. Please select a camera.")
+    
+    @staticmethod
+    @st.fragment
+    def _highlights_tab_fragment():
+        """Highlights tab body"""
+        if 'selected_camera' in st.session_state:
+            # Pass the camera manager object instead of just the camera ID
+            camera_manager = st.session_state.camera_managers[st.session_state.selected_camera]
+            UIComponents.create_highlights_tab(camera_manager)
+        else:
+            st.info("No highlights available. Please select a camera.")
+    
+    @staticmethod
+    @st.fragment
+    def _historical_tab_fragment():
+        """Historical data tab body"""
+        if 'selected_camera' in st.session_state:
+            # Pass the camera manager object instead of just the camera ID
+            camera_manager = st.session_state.camera_managers[st.session_state.selected_camera]
+            UIComponents.create_historical_tab(camera_manager)
+        else:
+            st.info("No historical data available. Please select a camera.")
+    
+    @staticmethod
+    @st.fragment
+    def _performance_tab_fragment():
+        """Performance tab body"""
+        if 'system_monitor' in st.session_state and st.session_state.system_monitor:
+            UIComponents.create_performance_monitoring_tab(st.session_state.system_monitor)
+        else:
+            st.info("System performance monitoring is not available. Please check your installation.")
+
+    @staticmethod
+    def encode_feed_frame(frame):
+        """Encode a BGR frame as JPEG bytes that st.image can send without re-encoding"""
+        ok, buf = cv2.imencode('.jpg', frame, [int(cv2.IMWRITE_JPEG_QUALITY), _FEED_JPEG_QUALITY])
+        if not ok:
+            raise ValueError("Failed to encode frame")
+        return buf.tobytes()
+    
+    @staticmethod
+    def update_feed(feed_container, camera_manager, message_queue, stop_event=None, heartbeat=None):
         """Background thread function to update the camera feed"""
+        if stop_event is None:
+            stop_event = threading.Event()
+        if heartbeat is None:
+            heartbeat = {'last_seen': time.time()}
         last_update_time = time.time()
         min_interval = 0.1  # Minimum time between updates (100ms)
+        last_sec = None
+        timestamp = None
+        
+        last_reconnect_time = 0
         
-        while True:
+        # Sleep between updates until the stop event is set
+        while not stop_event.wait(min_interval):
             try:
                 current_time = time.time()
-                # Check if enough time has passed since last update
-                if current_time - last_update_time < min_interval:
-                    time.sleep(0.01)  # Short sleep to prevent CPU hogging
+                
+                # The consumer stamps the heartbeat; stop once its session has gone away
+                if current_time - heartbeat['last_seen'] > _FEED_IDLE_TIMEOUT:
+                    logger.info("Live feed consumer went away, stopping feed thread")
+                    break
+                
+                # Try to bring a dropped camera back, at most once per _FEED_RECONNECT_INTERVAL
+                if not camera_manager.is_connected():
+                    if current_time - last_reconnect_time >= _FEED_RECONNECT_INTERVAL:
+                        last_reconnect_time = current_time
+                        message_queue.append({
+                            'type': 'error',
+                            'data': "Camera disconnected. Attempting to reconnect..."
+                        })
+                        camera_manager.reconnect()
                     continue
                 
                 frame = camera_manager.read_frame()
                 if frame is not None:
-                    # Convert frame to RGB for display
-                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                    # Write frame to recording if active
+                    camera_manager.write_frame(frame)
+                    
+                    # Timestamp is overlaid by the browser, not drawn into the frame;
+                    # only re-format it when the second changes
+                    sec = int(current_time)
+                    if sec != last_sec:
+                        timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+                        last_sec = sec
                     
-                    # Add timestamp to frame
-                    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    cv2.putText(frame_rgb, timestamp, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+                    # JPEG-encode once so the queue and browser get compressed bytes
+                    jpeg_bytes = UIComponents.encode_feed_frame(frame)
                     
-                    # Send frame and timestamp through queue
-                    message_queue.put({
+                    # Send JPEG bytes and timestamp through queue
+                    message_queue.append({
                         'type': 'frame',
-                        'data': (frame_rgb, timestamp)
+                        'data': (jpeg_bytes, timestamp)
                     })
                     last_update_time = current_time
                 else:
                     # Only send error message if enough time has passed
                     if current_time - last_update_time >= 1.0:
-                        message_queue.put({
+                        message_queue.append({
                             'type': 'error',
                             'data': "No frame available from camera"
                         })
                         last_update_time = current_time
-                    time.sleep(0.1)
                 
             except Exception as e:
                 # Only send error message if enough time has passed
                 if time.time() - last_update_time >= 1.0:
-                    message_queue.put({
+                    message_queue.append({
                         'type': 'error',
                         'data': f"Error updating feed: {str(e)}"
                     })
                     last_update_time = time.time()
-                time.sleep(0.1)
 
     @staticmethod
-    def create_live_monitoring_tab(camera_config, camera_status, weather_data):
-        """Create the live monitoring tab"""
-        st.header("Live Camera Feed")
-        
-        # Initialize camera manager in session state if not exists
-        if 'camera_manager' not in st.session_state:
-            # Get camera manager from the current camera's manager
-            camera_manager = st.session_state.camera_managers[camera_config['name']]
-            st.session_state.camera_manager = camera_manager
-            st.session_state.camera_connected = False
-            st.session_state.feed_thread = None
-            st.session_state.message_queue = Queue()
-            st.session_state.last_update = None
-            st.session_state.last_refresh = time.time()
-        
-        # Create feed container
+    def create_live_monitoring_tab(camera_connected, weather_data):
+        """Create the live monitoring tab; a feed thread reads the camera and a timed fragment shows its frames"""
+        # The feed always follows the selected camera
+        camera_manager = st.session_state.camera_managers[st.session_state.selected_camera]
+        
+        # Initialize the live feed state if not exists
+        if 'message_queue' not in st.session_state:
+            st.session_state.feed_thread = None
+            # Bounded deque: appends drop the oldest message once full
+            st.session_state.message_queue = deque(maxlen=2)
+            st.session_state.last_update = None
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            # Reconnect in place; the feed fragment picks up the new frames
+            if st.button("Reconnect Camera", key="ui_reconnect_camera_btn"):
+                UIComponents.stop_feed_thread()
+                camera_manager.disconnect()
+                camera_connected = st.session_state.camera_connected = camera_manager.connect()
+                if camera_connected:
+                    st.success("Camera reconnected successfully")
+                else:
+                    st.error("Failed to reconnect camera")
+        with col2:
+            if st.button("Stop" if st.session_state.streaming else "Start", key="ui_stream_control_btn"):
+                st.session_state.streaming = not st.session_state.streaming
+                st.rerun()
+        
+        # Display camera feed or error message
+        st.markdown("### Live Feed")
+        if not camera_connected:
+            UIComponents.stop_feed_thread()
+            st.error("Camera is not connected. Please check your camera connection or settings.")
+            if st.button("Try Reconnect", key="try_reconnect_btn"):
+                st.session_state.camera_connected = False
+                st.rerun()
+        elif not st.session_state.streaming:
+            UIComponents.stop_feed_thread()
+            st.info("Streaming is stopped. Click 'Start' to resume the live feed.")
+        else:
+            # Start the feed thread if not running, or move it to a newly selected camera
+            UIComponents._ensure_feed_thread(camera_manager)
+            
+            # Redraw only the feed on a timer instead of rerunning the whole app
+            live_feed = st.fragment(run_every=st.session_state.get('refresh_rate', 0.5))(UIComponents._live_feed_fragment)
+            live_feed()
+        
+        # Display weather metrics if available
+        if weather_data:
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Temperature", f"{weather_data.get('temperature', 'N/A')}°C")
+                st.metric("Humidity", f"{weather_data.get('humidity', 'N/A')}%")
+            with col2:
+                st.metric("Visibility", f"{weather_data.get('visibility', 'N/A')} km")
+                st.metric("Condition", weather_data.get('condition', 'N/A'))
+        else:
+            st.warning("Weather data is not available. Please check your weather API settings.")
+    
+    @staticmethod
+    def _start_feed_thread(camera_manager):
+        """Start the live feed thread for a camera; frames reach the UI through the message queue"""
+        st.session_state.feed_stop = threading.Event()
+        st.session_state.feed_camera = camera_manager
+        st.session_state.feed_heartbeat = {'last_seen': time.time()}
+        st.session_state.feed_thread = threading.Thread(
+            target=UIComponents.update_feed,
+            args=(None, camera_manager, st.session_state.message_queue,
+                  st.session_state.feed_stop, st.session_state.feed_heartbeat),
+            daemon=True
+        )
+        st.session_state.feed_thread.start()
+    
+    @staticmethod
+    def _ensure_feed_thread(camera_manager):
+        """Keep exactly one live feed thread running, reading from camera_manager"""
+        feed_thread = st.session_state.get('feed_thread')
+        if feed_thread is not None and feed_thread.is_alive() and st.session_state.get('feed_camera') is camera_manager:
+            return
+        
+        # Stop a thread left on another camera and drop its frames
+        UIComponents.stop_feed_thread()
+        st.session_state.message_queue.clear()
+        st.session_state.last_frame_html = None
+        st.session_state.last_update = None
+        UIComponents._start_feed_thread(camera_manager)
+    
+    @staticmethod
+    def stop_feed_thread():
+        """Signal the live feed thread to exit and wait briefly for it"""
+        stop_event = st.session_state.get('feed_stop')
+        if stop_event is not None:
+            stop_event.set()
+        feed_thread = st.session_state.get('feed_thread')
+        if feed_thread is not None and feed_thread.is_alive():
+            feed_thread.join(0.5)
+        st.session_state.feed_thread = None
+        st.session_state.feed_camera = None
+    
+    @staticmethod
+    def _live_feed_fragment():
+        """Render the newest queued live-feed message and the last update time"""
         feed_container = st.empty()
         
-        # Create status container
-        status_container = st.container()
+        # Tell the producer this session is still consuming
+        heartbeat = st.session_state.get('feed_heartbeat')
+        if heartbeat is not None:
+            heartbeat['last_seen'] = time.time()
         
-        # Create controls container
-        controls_container = st.container()
+        # Restart a producer that timed out while this session was idle, so frames and recording resume
+        feed_thread = st.session_state.get('feed_thread')
+        if st.session_state.get('streaming') and (feed_thread is None or not feed_thread.is_alive()):
+            UIComponents._ensure_feed_thread(st.session_state.camera_managers[st.session_state.selected_camera])
         
-        # Check camera connection
-        if not st.session_state.camera_connected:
-            if st.session_state.camera_manager.connect():
-                st.session_state.camera_connected = True
-                st.success("Camera connected successfully!")
-            else:
-                st.error("Failed to connect to camera. Please check the connection and try again.")
-        
-        # Display camera feed
-        if st.session_state.camera_connected:
-            # Start feed update thread if not running
-            if not st.session_state.feed_thread or not st.session_state.feed_thread.is_alive():
-                st.session_state.feed_thread = threading.Thread(
-                    target=UIComponents.update_feed,
-                    args=(feed_container, st.session_state.camera_manager, st.session_state.message_queue),
-                    daemon=True
-                )
-                st.session_state.feed_thread.start()
-            
-            # Process messages from the queue with rate limiting
-            current_time = time.time()
-            if current_time - st.session_state.last_refresh >= st.session_state.refresh_rate:
-                messages_processed = 0
-                max_messages_per_refresh = 5  # Limit number of messages processed per refresh
-                
-                while not st.session_state.message_queue.empty() and messages_processed < max_messages_per_refresh:
-                    try:
-                        msg = st.session_state.message_queue.get_nowait()
-                        if msg['type'] == 'frame':
-                            frame_rgb, timestamp = msg['data']
-                            feed_container.image(frame_rgb, use_container_width=True)
-                            st.session_state.last_update = timestamp
-                        elif msg['type'] == 'error':
-                            st.error(msg['data'])
-                        messages_processed += 1
-                    except:
-                        break
-                
-                st.session_state.last_refresh = current_time
-            
-            # Display last update time
-            if st.session_state.last_update:
-                status_container.text(f"Last update: {st.session_state.last_update}")
-            
-            # Add manual refresh and reconnect buttons
-            col1, col2 = controls_container.columns(2)
-            with col1:
-                if st.button("Refresh Feed"):
-                    if st.session_state.feed_thread and st.session_state.feed_thread.is_alive():
-                        st.session_state.feed_thread.join(timeout=1.0)
-                    # Clear the message queue
-                    while not st.session_state.message_queue.empty():
-                        st.session_state.message_queue.get_nowait()
-                    # Start new thread
-                    st.session_state.feed_thread = threading.Thread(
-                        target=UIComponents.update_feed,
-                        args=(feed_container, st.session_state.camera_manager, st.session_state.message_queue),
-                        daemon=True
-                    )
-                    st.session_state.feed_thread.start()
-                    st.session_state.last_refresh = time.time()
-            
-            with col2:
-                if st.button("Reconnect Camera"):
-                    if st.session_state.feed_thread and st.session_state.feed_thread.is_alive():
-                        st.session_state.feed_thread.join(timeout=1.0)
-                    st.session_state.camera_manager.disconnect()
-                    st.session_state.camera_connected = False
-                    # Clear the message queue
-                    while not st.session_state.message_queue.empty():
-                        st.session_state.message_queue.get_nowait()
-                    st.rerun()
-        else:
-            st.warning("Camera disconnected. Click 'Reconnect Camera' to try again.")
-            if st.button("Reconnect Camera"):
-                st.session_state.camera_connected = False
-                st.rerun()
+        # Keep the producer (and any recording) alive but skip drawing while another tab is selected
+        selected_tab = st.session_state.get('main_tabs')
+        if selected_tab is not None and selected_tab != _TAB_LABELS[0]:
+            return
+        
+        # Take the newest message and discard anything older
+        message_queue = st.session_state.message_queue
+        msg = message_queue.pop() if message_queue else None
+        message_queue.clear()
+        
+        if msg is not None:
+            if msg['type'] == 'frame':
+                jpeg_bytes, timestamp = msg['data']
+                st.session_state.last_frame_html = _feed_frame_html(jpeg_bytes, timestamp)
+                st.session_state.last_update = timestamp
+            elif msg['type'] == 'error':
+                st.error(msg['data'])
+        
+        # Keep showing the last frame until a newer one arrives
+        if st.session_state.get('last_frame_html'):
+            feed_container.markdown(st.session_state.last_frame_html, unsafe_allow_html=True)
+        
+        # Display last update time
+        if st.session_state.last_update:
+            st.text(f"Last update: {st.session_state.last_update}")
     
     @staticmethod
     def create_analytics_tab(camera_manager):
@@ -582,79 +1317,40 @@ class UIComponents:
                             time.sleep(1)
                             st.experimental_rerun()
             
-            # Helper method to create metrics with tooltips
-            def metric_with_tooltip(label, value, delta=None, tooltip="", help_text=""):
-                col = st.column_config.Column(
-                    label, help=help_text
-                )
-                with st.container():
-                    metric = st.metric(label, value, delta)
-                    if tooltip:
-                        st.markdown(f"<small><i>{tooltip}</i></small>", unsafe_allow_html=True)
-                return metric
-            
-            # Create three columns for metrics - show these even if camera is disconnected
-            # as long as we have some data
+            # Show metrics even if camera is disconnected as long as we have some data
             if has_valid_data or camera_manager.is_connected():
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    # Get the current brightness value and format it
-                    brightness = camera_data.get('brightness', 0)
-                    brightness_text = f"{brightness:.1f}" if brightness is not None else "N/A"
-                    
-                    # Display the brightness metric with a tooltip
-                    metric_with_tooltip("Brightness", brightness_text, 
-                                    tooltip="Average pixel brightness (0-255)",
-                                    help_text="Average pixel intensity; higher values indicate brighter images")
-                    
-                    # Get the current edge score and format it
-                    edge_score = camera_data.get('edge_score', 0)
-                    edge_score_text = f"{edge_score:.1f}" if edge_score is not None else "N/A"
-                    
-                    # Display the edge score metric with a tooltip
-                    metric_with_tooltip("Edge Score", edge_score_text,
-                                    tooltip="Edge detection score (0-100)",
-                                    help_text="Measure of image detail/clarity based on edge detection")
-                
-                with col2:
-                    # Get the current contrast value and format it
-                    contrast = camera_data.get('contrast', 0)
-                    contrast_text = f"{contrast:.1f}" if contrast is not None else "N/A"
-                    
-                    # Display the contrast metric with a tooltip
-                    metric_with_tooltip("Contrast", contrast_text,
-                                    tooltip="Image contrast level (0-100)",
-                                    help_text="Difference between light and dark areas; higher values indicate more contrast")
-                    
-                    # Get the current color delta average and format it
-                    color_delta = camera_data.get('color_delta_avg', 0)
-                    color_delta_text = f"{color_delta:.1f}" if color_delta is not None else "N/A"
-                    
-                    # Display the color delta metric with a tooltip
-                    metric_with_tooltip("Color Delta", color_delta_text,
-                                    tooltip="Average color difference (0-100)",
-                                    help_text="Measure of color variation between regions; lower values indicate better visibility")
-                
-                with col3:
-                    # Get the current visibility score and format it
-                    visibility_score = camera_data.get('visibility_score', 0)
-                    visibility_score_text = f"{visibility_score:.1f}%" if visibility_score is not None else "N/A"
-                    
-                    # Determine delta color based on visibility status
-                    visibility_status = camera_data.get('visibility_status', 'Unknown')
-                    delta_color = "normal" if visibility_status == "Good" else "inverse"
-                    
-                    # Display the visibility score metric with a tooltip
-                    metric_with_tooltip("Visibility Score", visibility_score_text,
-                                    tooltip=f"Current visibility status: {visibility_status}",
-                                    help_text="Overall visibility score based on brightness, contrast, and other factors")
-                    
-                    # Get the current visibility status and format it
-                    status_color = "green" if visibility_status == "Good" else "orange" if visibility_status == "Fair" else "red"
-                    
-                    # Display the visibility status metric with a tooltip
-                    st.markdown(f"<p style='color: {status_color}; font-weight: bold;'>Status: {visibility_status}</p>", unsafe_allow_html=True)
+                def fmt(value, suffix=""):
+                    return f"{value:.1f}{suffix}" if value is not None else "N/A"
+                
+                visibility_status = camera_data.get('visibility_status', 'Unknown')
+                
+                # (label, value, tooltip, help text) for each metric card
+                rows = [
+                    ("Brightness", fmt(camera_data.get('brightness', 0)),
+                     "Average pixel brightness (0-255)",
+                     "Average pixel intensity; higher values indicate brighter images"),
+                    ("Contrast", fmt(camera_data.get('contrast', 0)),
+                     "Image contrast level (0-100)",
+                     "Difference between light and dark areas; higher values indicate more contrast"),
+                    ("Visibility Score", fmt(camera_data.get('visibility_score', 0), "%"),
+                     f"Current visibility status: {visibility_status}",
+                     "Overall visibility score based on brightness, contrast, and other factors"),
+                    ("Edge Score", fmt(camera_data.get('edge_score', 0)),
+                     "Edge detection score (0-100)",
+                     "Measure of image detail/clarity based on edge detection"),
+                    ("Color Delta", fmt(camera_data.get('color_delta_avg', 0)),
+                     "Average color difference (0-100)",
+                     "Measure of color variation between regions; lower values indicate better visibility"),
+                ]
+                
+                # Render all metric cards and the status badge in a single call
+                cards = "".join(
+                    f'<div class="metric-card" title="{help_text}"><label>{label}</label>'
+                    f'<span class="metric-value">{value}</span><small><i>{tooltip}</i></small></div>'
+                    for label, value, tooltip, help_text in rows
+                )
+                st.markdown(f'{_METRIC_GRID_CSS}<div class="metric-grid">{cards}<div class="metric-card">{_vis_badge(visibility_status)}</div></div>',
+                            unsafe_allow_html=True)
             else:
                 st.info("No analytics data available yet. This section will update once data is collected.")
                 
@@ -663,62 +1359,20 @@ class UIComponents:
             
             # Create placeholder data for visualization
             # In a real app, this would come from the camera manager
-            timestamps = pd.date_range(start="2023-04-01", periods=24, freq="H")
-            vis_data = {
-                "timestamp": timestamps,
-                "visibility_score": [random.randint(50, 100) for _ in range(24)],
-                "brightness": [random.randint(100, 200) for _ in range(24)],
-                "contrast": [random.randint(30, 90) for _ in range(24)],
-                "edge_score": [random.randint(40, 80) for _ in range(24)]
-            }
-            
-            df = pd.DataFrame(vis_data)
+            df = _synth_vis_df(int(time.time() // 3600))
             
             # Create visualization
-            st.line_chart(df.set_index("timestamp")[["visibility_score"]])
+            st.line_chart(df, y="visibility_score")
             
             # Show more detailed view in expander
             with st.expander("Detailed Metrics", expanded=False):
-                # Create multiple line chart with all metrics
-                fig = make_subplots(specs=[[{"secondary_y": True}]])
-                
-                # Add visibility score trace
-                fig.add_trace(
-                    go.Scatter(x=df["timestamp"], y=df["visibility_score"], name="Visibility Score"),
-                    secondary_y=False,
-                )
-                
-                # Add brightness trace
-                fig.add_trace(
-                    go.Scatter(x=df["timestamp"], y=df["brightness"], name="Brightness"),
-                    secondary_y=True,
-                )
-                
-                # Add contrast trace
-                fig.add_trace(
-                    go.Scatter(x=df["timestamp"], y=df["contrast"], name="Contrast"),
-                    secondary_y=False,
-                )
-                
-                # Add edge score trace
-                fig.add_trace(
-                    go.Scatter(x=df["timestamp"], y=df["edge_score"], name="Edge Score"),
-                    secondary_y=False,
-                )
-                
-                # Set titles and labels
-                fig.update_layout(
-                    title_text="Detailed Visibility Metrics",
-                    height=500
-                )
-                fig.update_xaxes(title_text="Time")
-                fig.update_yaxes(title_text="Score (0-100)", secondary_y=False)
-                fig.update_yaxes(title_text="Brightness (0-255)", secondary_y=True)
-                
-                st.plotly_chart(fig, use_container_width=True)
-                
-                # Show data table
-                st.dataframe(df)
+                # Expander bodies always run, so only build the chart and table on request
+                if st.checkbox("Load detailed chart", key="show_detail"):
+                    # Line chart with all metrics
+                    st.line_chart(df, height=500)
+                    
+                    # Show data table
+                    st.dataframe(df)
                 
         except Exception as e:
             st.error(f"Error displaying analytics: {str(e)}")
@@ -732,25 +1386,24 @@ class UIComponents:
         
         # Initialize ROI preview in session state if not exists
         if 'roi_preview' not in st.session_state:
-            st.session_state.roi_preview = {
-                "name": "New ROI",
-                "x": 0.1,
-                "y": 0.1,
-                "width": 0.2,
-                "height": 0.2,
-                "distance": 100
-            }
+            st.session_state.roi_preview = _ROI_DEFAULTS.copy()
         
-        # Initialize roi_preview_frame in session state
-        if 'roi_preview_frame' not in st.session_state:
-            st.session_state.roi_preview_frame = None
-            try:
-                # Try to get a frame from the camera
-                if camera_manager and camera_manager.is_connected():
-                    frame = camera_manager.read_frame()
+        # Check the camera connection once for the whole run
+        connected = camera_manager is not None and camera_manager.is_connected()
+        
+        # Fetch the preview frame; reads are shared per camera for _ROI_PREVIEW_TTL seconds
+        st.session_state.setdefault('roi_preview_frame', None)
+        st.session_state.setdefault('roi_preview_key', None)
+        try:
+            # Try to get a frame from the camera, keeping the previous one on failure
+            if connected:
+                frame = _get_preview_frame(camera_manager.camera_id, camera_manager)
+                if frame is not None and frame is not st.session_state.roi_preview_frame:
                     st.session_state.roi_preview_frame = frame
-            except Exception as e:
-                st.warning(f"Could not get camera frame for preview: {str(e)}")
+                    # Camera and process-unique id identify the frame for the shared overlay cache
+                    st.session_state.roi_preview_key = (camera_manager.camera_id, next(_PREVIEW_FRAME_IDS))
+        except Exception as e:
+            st.warning(f"Could not get camera frame for preview: {str(e)}")
         
         # Threshold settings
         st.subheader("Visibility Thresholds")
@@ -764,7 +1417,7 @@ class UIComponents:
                 "Brightness Threshold",
                 min_value=0,
                 max_value=255,
-                value=camera_config.get('brightness_threshold', 50),
+                value=camera_config.get('brightness_threshold', _THRESHOLD_DEFAULTS['brightness_threshold']),
                 help="Minimum brightness level to consider good visibility"
             )
             
@@ -773,7 +1426,7 @@ class UIComponents:
                 "Contrast Threshold",
                 min_value=0,
                 max_value=100,
-                value=camera_config.get('contrast_threshold', 30),
+                value=camera_config.get('contrast_threshold', _THRESHOLD_DEFAULTS['contrast_threshold']),
                 help="Minimum contrast level to consider good visibility"
             )
         
@@ -783,7 +1436,7 @@ class UIComponents:
                 "Edge Detection Threshold",
                 min_value=0,
                 max_value=100,
-                value=camera_config.get('edge_threshold', 20),
+                value=camera_config.get('edge_threshold', _THRESHOLD_DEFAULTS['edge_threshold']),
                 help="Minimum edge score to consider good visibility"
             )
             
@@ -792,29 +1445,29 @@ class UIComponents:
                 "Overall Visibility Threshold",
                 min_value=0,
                 max_value=100,
-                value=camera_config.get('visibility_threshold', 70),
+                value=camera_config.get('visibility_threshold', _THRESHOLD_DEFAULTS['visibility_threshold']),
                 help="Minimum overall score to consider good visibility"
             )
         
         # Check if thresholds changed
-        threshold_changes = {}
-        
-        if camera_config.get('brightness_threshold', 50) != brightness_threshold:
-            threshold_changes['brightness_threshold'] = brightness_threshold
-            
-        if camera_config.get('contrast_threshold', 30) != contrast_threshold:
-            threshold_changes['contrast_threshold'] = contrast_threshold
-            
-        if camera_config.get('edge_threshold', 20) != edge_threshold:
-            threshold_changes['edge_threshold'] = edge_threshold
-            
-        if camera_config.get('visibility_threshold', 70) != visibility_threshold:
-            threshold_changes['visibility_threshold'] = visibility_threshold
+        new_thresholds = {
+            'brightness_threshold': brightness_threshold,
+            'contrast_threshold': contrast_threshold,
+            'edge_threshold': edge_threshold,
+            'visibility_threshold': visibility_threshold
+        }
+        threshold_changes = {k: v for k, v in new_thresholds.items()
+                             if camera_config.get(k, _THRESHOLD_DEFAULTS[k]) != v}
         
         # Show apply button if thresholds changed
         if threshold_changes and st.button("Apply Threshold Changes", key="apply_threshold_btn"):
             st.success("Visibility thresholds updated")
         
+        # Confirm an ROI edit applied by the previous run
+        notice = st.session_state.pop('roi_notice', None)
+        if notice:
+            st.success(notice)
+        
         # Create two columns for the ROI configuration
         col1, col2 = st.columns([1, 1])
         
@@ -822,8 +1475,8 @@ class UIComponents:
         with col1:
             st.subheader("Existing ROIs")
             
-            # Get current ROIs
-            roi_regions = camera_manager.get_roi_regions()
+            # Get current ROIs (copied so edits are only applied through the queued update)
+            roi_regions = list(camera_manager.get_roi_regions())
             
             if not roi_regions:
                 st.info("No ROIs defined for this camera. Add a new ROI to start.")
@@ -832,21 +1485,20 @@ class UIComponents:
                 # Create a selection widget for ROIs
                 st.write("Select an ROI to edit or delete:")
                 
-                # Format ROI display with more information
-                def format_func(roi):
-                    name = roi.get("name", "Unnamed ROI")
-                    x = roi.get("x", 0)
-                    y = roi.get("y", 0)
-                    width = roi.get("width", 0)
-                    height = roi.get("height", 0)
-                    distance = roi.get("distance", 100)
-                    return f"{name} (Position: {x:.2f}, {y:.2f} - Size: {width:.2f}x{height:.2f} - Distance: {distance}m)"
+                # Format ROI display with more information, built once per run
+                labels = [
+                    f"{roi.get('name', 'Unnamed ROI')} (Position: {roi.get('x', 0):.2f}, {roi.get('y', 0):.2f}"
+                    f" - Size: {roi.get('width', 0):.2f}x{roi.get('height', 0):.2f}"
+                    f" - Distance: {roi.get('distance', 100)}m)"
+                    for roi in roi_regions
+                ]
                 
                 # Create a selection box for ROIs
                 selected_roi_index = st.selectbox(
                     "Select ROI",
-                    options=list(range(len(roi_regions))),
-                    format_func=lambda i: format_func(roi_regions[i])
+                    options=range(len(labels)),
+                    format_func=labels.__getitem__,
+                    key=f"roi_select_{len(roi_regions)}"
                 )
                 
                 # Show selected ROI details and provide delete button
@@ -873,51 +1525,23 @@ class UIComponents:
                 if st.button("Delete Selected ROI", key="delete_roi_btn"):
                     roi_regions.pop(selected_roi_index)
                     
-                    # Update camera with modified ROI list
-                    camera_manager.set_roi_regions(roi_regions)
+                    # Queue the modified ROI list for the camera
+                    st.session_state.roi_regions = roi_regions
+                    st.session_state.roi_dirty = True
+                    st.session_state.last_roi_submitted = None
                     
-                    st.success(f"Deleted ROI: {selected_roi.get('name', 'Unnamed')}")
-                    st.rerun()
+                    st.session_state.roi_notice = f"Deleted ROI: {selected_roi.get('name', 'Unnamed')}"
                     
             # Display live preview with current ROIs
             st.subheader("Live Preview")
-            if 'roi_preview_frame' not in st.session_state:
-                st.session_state.roi_preview_frame = None
-                try:
-                    # Try to get a frame from the camera
-                    if camera_manager and camera_manager.is_connected():
-                        frame = camera_manager.read_frame()
-                        st.session_state.roi_preview_frame = frame
-                except Exception as e:
-                    st.warning(f"Could not get camera frame for preview: {str(e)}")
-                    
-            if st.session_state.roi_preview_frame is not None:
-                # Clone the frame to avoid modifying the original
-                preview_img = st.session_state.roi_preview_frame.copy()
-                h, w = preview_img.shape[:2]
-                
-                # Draw existing ROIs
-                for i, roi in enumerate(roi_regions):
-                    x = int(roi["x"] * w)
-                    y = int(roi["y"] * h)
-                    width = int(roi["width"] * w)
-                    height = int(roi["height"] * h)
-                    
-                    # Draw rectangle with different colors
-                    color = (0, 255, 0)  # Default green color
-                    if i == selected_roi_index:
-                        color = (0, 0, 255)  # Red for selected ROI
-                        
-                    # Draw ROI rectangle
-                    cv2.rectangle(preview_img, (x, y), (x + width, y + height), color, 2)
-                    
-                    # Add ROI name
-                    cv2.putText(preview_img, roi["name"], (x+5, y+20), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 2)
-                
-                # Convert to RGB for display
-                preview_rgb = cv2.cvtColor(preview_img, cv2.COLOR_BGR2RGB)
-                st.image(preview_rgb, caption="Current ROIs", use_column_width=True)
+            preview_frame = st.session_state.get('roi_preview_frame')
+            if preview_frame is not None:
+                # Draw existing ROIs, highlighting the selected one
+                preview_img = _render_roi_overlay(st.session_state.roi_preview_key, preview_frame,
+                                                  _roi_tuples(roi_regions), selected_roi_index)
+                
+                st.image(preview_img, caption="Current ROIs" if roi_regions else "No ROIs defined",
+                         use_column_width=True)
             else:
                 st.warning("No camera frame available for preview.")
         
@@ -925,141 +1549,115 @@ class UIComponents:
         with col2:
             st.subheader("Add/Edit ROI")
             
-                # ROI Name
+            # Resolve all form defaults in one pass
+            roi_defaults = {**_ROI_DEFAULTS, **st.session_state.roi_preview}
+            
+            # ROI Name
             roi_name = st.text_input("ROI Name", 
-                               value=st.session_state.roi_preview.get("name", ""))
+                               value=roi_defaults["name"])
             
             # When we update ROI settings, update the preview immediately
             def update_preview():
-                if 'roi_preview_frame' not in st.session_state:
-                    st.session_state.roi_preview_frame = None
-                    try:
-                        # Try to get a frame from the camera
-                        if camera_manager and camera_manager.is_connected():
-                            frame = camera_manager.read_frame()
-                            st.session_state.roi_preview_frame = frame
-                    except Exception as e:
-                        st.warning(f"Could not get camera frame for preview: {str(e)}")
-                        return None
-                
-                if st.session_state.roi_preview_frame is not None:
-                    preview_img = st.session_state.roi_preview_frame.copy()
-                    h, w = preview_img.shape[:2]
-                    
-                    # Draw existing ROIs first in green
-                    for roi in camera_manager.get_roi_regions():
-                        x = int(roi["x"] * w)
-                        y = int(roi["y"] * h)
-                        width = int(roi["width"] * w)
-                        height = int(roi["height"] * h)
-                        cv2.rectangle(preview_img, (x, y), (x + width, y + height), (0, 255, 0), 2)
-                        cv2.putText(preview_img, roi["name"], (x+5, y+20), 
-                                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-                    
-                    # Draw preview ROI in blue
-                    x = int(st.session_state.x_slider * w)
-                    y = int(st.session_state.y_slider * h)
-                    width = int(st.session_state.width_slider * w)
-                    height = int(st.session_state.height_slider * h)
-                    
-                    cv2.rectangle(preview_img, (x, y), (x + width, y + height), (255, 0, 0), 2)
-                    cv2.putText(preview_img, roi_name if roi_name else "New ROI", (x+5, y+20), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 0), 2)
-                    
-                    # Display preview
-                    preview_rgb = cv2.cvtColor(preview_img, cv2.COLOR_BGR2RGB)
-                    return preview_rgb
+                preview_frame = st.session_state.get('roi_preview_frame')
+                if preview_frame is not None:
+                    # Draw existing ROIs in green and the ROI being edited in blue
+                    draft = (roi_name if roi_name else "New ROI", st.session_state.x_slider, st.session_state.y_slider,
+                             st.session_state.width_slider, st.session_state.height_slider)
+                    return _render_roi_overlay(st.session_state.roi_preview_key, preview_frame,
+                                               _roi_tuples(roi_regions), draft=draft)
                 return None
             
             # ROI coordinates with real-time preview
             x = st.slider("Position X", min_value=0.0, max_value=1.0, 
-                        value=st.session_state.roi_preview.get("x", 0.1), step=0.01,
+                        value=roi_defaults["x"], step=0.01,
                         key="x_slider",
                              help="Horizontal position relative to frame width (0-1)")
             
             y = st.slider("Position Y", min_value=0.0, max_value=1.0, 
-                        value=st.session_state.roi_preview.get("y", 0.1), step=0.01,
+                        value=roi_defaults["y"], step=0.01,
                         key="y_slider",
                              help="Vertical position relative to frame height (0-1)")
                 
             # ROI size
             width = st.slider("Width", min_value=0.05, max_value=1.0, 
-                           value=st.session_state.roi_preview.get("width", 0.2), step=0.01,
+                           value=roi_defaults["width"], step=0.01,
                            key="width_slider",
                                  help="Width relative to frame width (0-1)")
             
             height = st.slider("Height", min_value=0.05, max_value=1.0, 
-                            value=st.session_state.roi_preview.get("height", 0.2), step=0.01,
+                            value=roi_defaults["height"], step=0.01,
                             key="height_slider",
                                   help="Height relative to frame height (0-1)")
                 
             # Distance parameter
             distance = st.number_input("Distance (meters)", min_value=1, max_value=1000, 
-                                    value=st.session_state.roi_preview.get("distance", 100),
+                                    value=roi_defaults["distance"],
                                          help="Estimated distance to this region in meters")
                 
-            # Update preview
-            preview_img = update_preview()
-            if preview_img is not None:
-                st.image(preview_img, caption="ROI Preview", use_column_width=True)
+            # Slider-driven preview is opt-in so slider ticks don't redraw the frame by default
+            if st.checkbox("Show live preview", value=False, key="roi_live_preview"):
+                preview_img = update_preview()
+                if preview_img is not None:
+                    st.image(preview_img, caption="ROI Preview", use_column_width=True)
             
             # ROI action buttons
-            col1, col2 = st.columns(2)
+            btn_col1, btn_col2 = st.columns(2)
             
-            with col1:
+            with btn_col1:
                 if st.button("Add as New ROI", use_container_width=True, key="add_new_roi_btn"):
                     # Create new ROI definition
-                    new_roi = {
-                        "name": roi_name if roi_name else f"ROI_{len(roi_regions)}",
-                        "x": x,
-                        "y": y,
-                        "width": width,
-                        "height": height,
-                        "distance": distance
-                    }
-                    
-                    # Add to existing ROIs
-                    roi_regions.append(new_roi)
+                    new_form = ROIForm(roi_name if roi_name else f"ROI_{len(roi_regions)}",
+                                       x, y, width, height, distance)
                     
-                    # Update camera with modified ROI list
-                    camera_manager.set_roi_regions(roi_regions)
-                    
-                    st.success(f"Added new ROI: {new_roi['name']}")
-                    st.rerun()
+                    # Skip re-submits of the same values for the same target
+                    if (None, new_form) == st.session_state.get('last_roi_submitted'):
+                        st.info("No changes to submit")
+                    else:
+                        # Add to existing ROIs
+                        new_roi = asdict(new_form)
+                        roi_regions.append(new_roi)
+                        
+                        # Queue the modified ROI list for the camera
+                        st.session_state.roi_regions = roi_regions
+                        st.session_state.roi_dirty = True
+                        st.session_state.last_roi_submitted = (None, new_form)
+                        
+                        st.session_state.roi_notice = f"Added new ROI: {new_roi['name']}"
             
-            with col2:
+            with btn_col2:
                 if st.button("Update Selected ROI", use_container_width=True, disabled=selected_roi_index is None, key="update_roi_btn"):
                     if selected_roi_index is not None:
                         # Update existing ROI
-                        roi_regions[selected_roi_index] = {
-                            "name": roi_name if roi_name else st.session_state.roi_preview.get("name", f"ROI_{selected_roi_index}"),
-                            "x": x,
-                            "y": y,
-                            "width": width,
-                            "height": height,
-                            "distance": distance
-                        }
-                        
-                        # Update camera with modified ROI list
-                        camera_manager.set_roi_regions(roi_regions)
+                        new_form = ROIForm(roi_name if roi_name else st.session_state.roi_preview.get("name", f"ROI_{selected_roi_index}"),
+                                           x, y, width, height, distance)
                         
-                        st.success(f"Updated ROI: {roi_regions[selected_roi_index]['name']}")
-                        st.rerun()
+                        # Skip re-submits of the same values for the same target
+                        if (selected_roi_index, new_form) == st.session_state.get('last_roi_submitted'):
+                            st.info("No changes to submit")
+                        else:
+                            roi_regions[selected_roi_index] = asdict(new_form)
+                            
+                            # Queue the modified ROI list for the camera
+                            st.session_state.roi_regions = roi_regions
+                            st.session_state.roi_dirty = True
+                            st.session_state.last_roi_submitted = (selected_roi_index, new_form)
+                            
+                            st.session_state.roi_notice = f"Updated ROI: {roi_regions[selected_roi_index]['name']}"
         
             # Explanation of ROI settings
             with st.expander("ROI Help"):
-                st.markdown("""
-                **Region of Interest (ROI) Configuration**
-                
-                ROIs are areas of the camera frame that are analyzed for visibility changes:
-                
-                - **Position (X,Y)**: The top-left corner of the ROI relative to the frame (0-1)
-                - **Width/Height**: Size of the ROI relative to the frame size (0-1)
-                - **Distance**: Estimated distance in meters to the ROI area, used for visibility distance estimation
-                
-                Each ROI is analyzed separately, and the system detects visibility changes in each region.
-                Place ROIs at different distances to help estimate visibility range.
-                """)
+                st.markdown(_ROI_HELP_TEXT)
+        
+        # Push this run's ROI edits to the camera in a single call, then redraw
+        # the ROI list and preview (already drawn from the old list) in this tab only
+        if st.session_state.get('roi_dirty'):
+            camera_manager.set_roi_regions(st.session_state.roi_regions)
+            st.session_state.roi_dirty = False
+            try:
+                st.rerun(scope="fragment")
+            except StreamlitAPIException:
+                # Not in a fragment rerun (e.g. a full-app run), so rerun the app
+                st.rerun()
         
         return threshold_changes
 
@@ -1068,43 +1666,36 @@ class UIComponents:
         """Create stream settings section in the sidebar"""
         st.sidebar.subheader("Stream Settings")
         
+        # Widgets write straight to session_state through their keys
+        st.session_state.setdefault('refresh_rate', 0.5)
+        st.session_state.setdefault('auto_reconnect', True)
+        st.session_state.setdefault('max_reconnect_attempts', 5)
+        
         # Stream refresh rate
-        refresh_rate = st.sidebar.slider(
+        st.sidebar.slider(
             "Refresh Rate (seconds)",
             min_value=0.1,
             max_value=5.0,
-            value=st.session_state.get('refresh_rate', 0.5),
             step=0.1,
+            key='refresh_rate',
             help="How often to refresh the stream (lower values give smoother video but use more CPU)"
         )
         
-        # Update session state if changed
-        if 'refresh_rate' not in st.session_state or st.session_state.refresh_rate != refresh_rate:
-            st.session_state.refresh_rate = refresh_rate
-        
         # Auto-reconnect settings
-        auto_reconnect = st.sidebar.checkbox(
+        st.sidebar.checkbox(
             "Auto-Reconnect",
-            value=st.session_state.get('auto_reconnect', True),
+            key='auto_reconnect',
             help="Automatically try to reconnect if connection is lost"
         )
         
-        # Update session state if changed
-        if 'auto_reconnect' not in st.session_state or st.session_state.auto_reconnect != auto_reconnect:
-            st.session_state.auto_reconnect = auto_reconnect
-        
         # Maximum reconnection attempts
-        max_attempts = st.sidebar.number_input(
+        st.sidebar.number_input(
             "Max Reconnection Attempts",
             min_value=1,
             max_value=100,
-            value=st.session_state.get('max_reconnect_attempts', 5),
+            key='max_reconnect_attempts',
             help="Maximum number of times to try reconnecting before giving up"
         )
-        
-        # Update session state if changed
-        if 'max_reconnect_attempts' not in st.session_state or st.session_state.max_reconnect_attempts != max_attempts:
-            st.session_state.max_reconnect_attempts = max_attempts
 
     @staticmethod
     def _create_display_settings_section():
@@ -1113,55 +1704,36 @@ class UIComponents:
         
         # Get current display settings from session state or use defaults
         if 'display_settings' not in st.session_state:
-            from ..config.settings import DEFAULT_DISPLAY_SETTINGS
             st.session_state.display_settings = DEFAULT_DISPLAY_SETTINGS.copy()
         
-        display_settings = st.session_state.display_settings
-        
         # Theme selection
-        theme = st.sidebar.selectbox(
+        st.sidebar.selectbox(
             "Theme",
             options=["Light", "Dark", "Auto"],
-            index=["Light", "Dark", "Auto"].index(display_settings.get('theme', 'Auto')),
-            help="UI color theme"
+            help="UI color theme",
+            **_bound('display_settings', 'theme', 'Auto')
         )
         
-        # Update session state if changed
-        if display_settings.get('theme') != theme:
-            display_settings['theme'] = theme
-        
         # Show/hide elements
-        show_timestamps = st.sidebar.checkbox(
+        st.sidebar.checkbox(
             "Show Timestamps",
-            value=display_settings.get('show_timestamps', True),
-            help="Show timestamp on camera feed"
+            help="Show timestamp on camera feed",
+            **_bound('display_settings', 'show_timestamps', True)
         )
         
-        # Update session state if changed
-        if display_settings.get('show_timestamps') != show_timestamps:
-            display_settings['show_timestamps'] = show_timestamps
-        
         # Show/hide metrics
-        show_metrics = st.sidebar.checkbox(
+        st.sidebar.checkbox(
             "Show Live Metrics",
-            value=display_settings.get('show_metrics', True),
-            help="Show live metrics on camera feed"
+            help="Show live metrics on camera feed",
+            **_bound('display_settings', 'show_metrics', True)
         )
         
-        # Update session state if changed
-        if display_settings.get('show_metrics') != show_metrics:
-            display_settings['show_metrics'] = show_metrics
-        
         # Overlay ROIs on camera feed
-        show_roi = st.sidebar.checkbox(
+        st.sidebar.checkbox(
             "Show ROIs",
-            value=display_settings.get('show_roi', True),
-            help="Show regions of interest on camera feed"
+            help="Show regions of interest on camera feed",
+            **_bound('display_settings', 'show_roi', True)
         )
-        
-        # Update session state if changed
-        if display_settings.get('show_roi') != show_roi:
-            display_settings['show_roi'] = show_roi
 
     @staticmethod
     def _create_analytics_settings_section():
@@ -1178,69 +1750,47 @@ class UIComponents:
                 'save_events': True
             }
         
-        analytics_settings = st.session_state.analytics_settings
-        
         # Enable/disable analytics
         enabled = st.sidebar.checkbox(
             "Enable Analytics", 
-            value=analytics_settings.get('enabled', True),
-            help="Enable visibility analytics processing"
+            help="Enable visibility analytics processing",
+            **_bound('analytics_settings', 'enabled', True)
         )
         
-        # Update session state if changed
-        if analytics_settings.get('enabled') != enabled:
-            analytics_settings['enabled'] = enabled
-        
         # Only show settings if analytics are enabled
         if enabled:
             # Analytics update interval
-            update_interval = st.sidebar.slider(
+            st.sidebar.slider(
                 "Update Interval (seconds)",
                 min_value=1,
                 max_value=30,
-                value=analytics_settings.get('update_interval', 5),
                 step=1,
-                help="How often to update analytics (higher values use less CPU)"
+                help="How often to update analytics (higher values use less CPU)",
+                **_bound('analytics_settings', 'update_interval', 5)
             )
             
-            # Update session state if changed
-            if analytics_settings.get('update_interval') != update_interval:
-                analytics_settings['update_interval'] = update_interval
-            
             # Detection threshold
-            detection_threshold = st.sidebar.slider(
+            st.sidebar.slider(
                 "Visibility Detection Threshold",
                 min_value=0,
                 max_value=100,
-                value=analytics_settings.get('detection_threshold', 70),
-                help="Threshold for detecting visibility issues (lower values are more sensitive)"
+                help="Threshold for detecting visibility issues (lower values are more sensitive)",
+                **_bound('analytics_settings', 'detection_threshold', 70)
             )
             
-            # Update session state if changed
-            if analytics_settings.get('detection_threshold') != detection_threshold:
-                analytics_settings['detection_threshold'] = detection_threshold
-            
             # Notification settings
-            notify_on_events = st.sidebar.checkbox(
+            st.sidebar.checkbox(
                 "Notify on Events",
-                value=analytics_settings.get('notify_on_events', True),
-                help="Show notifications when visibility changes are detected"
+                help="Show notifications when visibility changes are detected",
+                **_bound('analytics_settings', 'notify_on_events', True)
             )
             
-            # Update session state if changed
-            if analytics_settings.get('notify_on_events') != notify_on_events:
-                analytics_settings['notify_on_events'] = notify_on_events
-            
             # Save events
-            save_events = st.sidebar.checkbox(
+            st.sidebar.checkbox(
                 "Save Events",
-                value=analytics_settings.get('save_events', True),
-                help="Save visibility events to database"
+                help="Save visibility events to database",
+                **_bound('analytics_settings', 'save_events', True)
             )
-            
-            # Update session state if changed
-            if analytics_settings.get('save_events') != save_events:
-                analytics_settings['save_events'] = save_events
 
     @staticmethod
     def _create_weather_settings_section():
@@ -1261,43 +1811,31 @@ class UIComponents:
         # Enable/disable weather data
         enabled = st.sidebar.checkbox(
             "Enable Weather Data", 
-            value=weather_settings.get('enabled', True),
-            help="Fetch and display weather data"
+            help="Fetch and display weather data",
+            **_bound('weather_settings', 'enabled', True)
         )
         
-        # Update session state if changed
-        if weather_settings.get('enabled') != enabled:
-            weather_settings['enabled'] = enabled
-        
         # Only show settings if weather data is enabled
         if enabled:
             # Weather refresh interval
-            refresh_interval = st.sidebar.slider(
+            st.sidebar.slider(
                 "Refresh Interval (minutes)",
                 min_value=5,
                 max_value=60,
-                value=weather_settings.get('refresh_interval', 15),
                 step=5,
-                help="How often to update weather data (longer intervals reduce API calls)"
+                help="How often to update weather data (longer intervals reduce API calls)",
+                **_bound('weather_settings', 'refresh_interval', 15)
             )
             
-            # Update session state if changed
-            if weather_settings.get('refresh_interval') != refresh_interval:
-                weather_settings['refresh_interval'] = refresh_interval
-            
             # Temperature unit
-            display_unit = st.sidebar.radio(
+            st.sidebar.radio(
                 "Display Units",
                 options=["Metric", "Imperial"],
-                index=0 if weather_settings.get('display_unit', 'Metric') == 'Metric' else 1,
                 horizontal=True,
-                help="Temperature and distance units"
+                help="Temperature and distance units",
+                **_bound('weather_settings', 'display_unit', 'Metric')
             )
             
-            # Update session state if changed
-            if weather_settings.get('display_unit') != display_unit:
-                weather_settings['display_unit'] = display_unit
-            
             # Show weather location
             if 'selected_camera' in st.session_state and st.session_state.selected_camera:
                 if 'cameras' in st.session_state and st.session_state.selected_camera in st.session_state.cameras:
@@ -1416,11 +1954,9 @@ class UIComponents:
             )
         
         with col2:
-            resolution_options = ["320x240 (QVGA)", "640x480 (VGA)", "800x600 (SVGA)", 
-                                  "1280x720 (HD)", "1920x1080 (Full HD)"]
             resolution = st.selectbox(
                 "Maximum Resolution",
-                options=resolution_options,
+                options=_RESOLUTION_OPTIONS,
                 index=3,  # Default to HD
                 help="Higher resolution provides more detail but uses more resources"
             )
@@ -1502,72 +2038,13 @@ class UIComponents:
         # Current metrics display
         st.subheader("Current System Metrics")
         
-        col1, col2, col3 = st.columns(3)
+        # Convert memory usage to GB for display
+        values = {**current_metrics, 'memory_gb': current_metrics['memory_usage'] / 1024}
         
-        with col1:
-            st.metric(
-                "CPU Usage", 
-                f"{current_metrics['cpu_usage']:.1f}%",
-                delta=None,
-                delta_color="inverse"
-            )
-            
-            st.metric(
-                "Active Cameras", 
-                f"{current_metrics['camera_count']}",
-                delta=None
-            )
-            
-            st.metric(
-                "Errors (24h)", 
-                f"{current_metrics['error_count']}",
-                delta=None,
-                delta_color="inverse"
-            )
-            
-        with col2:
-            # Convert memory usage to GB for display
-            memory_gb = current_metrics['memory_usage'] / 1024
-            st.metric(
-                "Memory Usage", 
-                f"{memory_gb:.2f} GB",
-                delta=None,
-                delta_color="inverse"
-            )
-            
-            st.metric(
-                "Active ROIs", 
-                f"{current_metrics['active_rois']}",
-                delta=None
-            )
-            
-            st.metric(
-                "Connection Failures (24h)", 
-                f"{current_metrics['connection_failures']}",
-                delta=None,
-                delta_color="inverse"
-            )
-            
-        with col3:
-            st.metric(
-                "Disk Usage", 
-                f"{current_metrics['disk_usage']:.1f}%",
-                delta=None,
-                delta_color="inverse"
-            )
-            
-            st.metric(
-                "Processing Time", 
-                f"{current_metrics['processing_time']:.2f} ms",
-                delta=None,
-                delta_color="inverse"
-            )
-            
-            st.metric(
-                "Network Speed", 
-                f"{current_metrics['network_speed']:.2f} Mbps",
-                delta=None
-            )
+        for col, specs in zip(st.columns(3), _CURRENT_METRICS_SPEC):
+            with col:
+                for label, key, fmt, delta_color in specs:
+                    st.metric(label, fmt.format(values[key]), delta=None, delta_color=delta_color)
         
         # Display system info
         try:
@@ -1587,12 +2064,7 @@ class UIComponents:
                     st.markdown(f"- Platform: {system_info.get('platform', 'N/A')}")
                     st.markdown(f"- Python Version: {system_info.get('python_version', 'N/A')}")
                     
-                    # Convert uptime to days, hours, minutes
-                    uptime_seconds = system_info.get('uptime', 0)
-                    days, remainder = divmod(uptime_seconds, 86400)
-                    hours, remainder = divmod(remainder, 3600)
-                    minutes, _ = divmod(remainder, 60)
-                    st.markdown(f"- System Uptime: {int(days)}d {int(hours)}h {int(minutes)}m")
+                    st.markdown(f"- System Uptime: {_fmt_uptime(int(system_info.get('uptime', 0)))}")
         except Exception as e:
             st.warning(f"Could not parse system information: {str(e)}")
         
@@ -1600,152 +2072,46 @@ class UIComponents:
         st.subheader("Performance History")
         
         # Time period selection
-        time_options = {
-            "Last 6 Hours": 6,
-            "Last 12 Hours": 12,
-            "Last 24 Hours": 24,
-            "Last 3 Days": 72,
-            "Last 7 Days": 168
-        }
-        
-        selected_period = st.selectbox(
-            "Select Time Period",
-            options=list(time_options.keys()),
-            index=2  # Default to 24 hours
-        )
-        
-        hours = time_options[selected_period]
-        metrics_history = system_monitor.get_metrics_history(hours=hours)
+        period_col, refresh_col = st.columns([4, 1])
+        with period_col:
+            selected_period = st.selectbox(
+                "Select Time Period",
+                options=tuple(_TIME_OPTIONS),
+                index=2  # Default to 24 hours
+            )
+        with refresh_col:
+            refresh = st.button("Refresh", key="perf_refresh_btn", use_container_width=True)
+        
+        hours = _TIME_OPTIONS[selected_period]
+        
+        # Reuse the last history for this period until a new collection interval has passed
+        now = time.monotonic()
+        cached = st.session_state.get('perf_history')
+        if (refresh or cached is None or cached[0] != hours
+                or now - st.session_state.get('perf_last_render', 0.0) >= system_monitor.metrics_interval):
+            if refresh:
+                _load_metrics.clear()
+            metrics = _load_metrics(hours, id(system_monitor), system_monitor)
+            fig = None
+            if metrics and len(metrics['timestamp']):
+                # Build (or reuse) the performance figure for this history
+                # The newest bucket's aggregates change in place, so key on its values as well as its timestamp
+                timestamps = metrics['timestamp']
+                last_row = tuple(values[-1] for values in metrics.values())
+                fig = _build_performance_fig(hours, len(timestamps), last_row, metrics)
+            st.session_state.perf_history = (hours, metrics, fig)
+            st.session_state.perf_last_render = now
+        else:
+            _, metrics, fig = cached
         
-        if not metrics_history:
+        if fig is None:
             st.info("No performance history data available for the selected period.")
         else:
-            # Convert to pandas DataFrame for easier plotting
-            import pandas as pd
-            import plotly.graph_objects as go
-            from plotly.subplots import make_subplots
-            
-            # Convert list of dictionaries to DataFrame
-            df = pd.DataFrame(metrics_history)
-            
-            # Convert timestamp strings to datetime objects if needed
-            if 'timestamp' in df.columns and isinstance(df['timestamp'][0], str):
-                df['timestamp'] = pd.to_datetime(df['timestamp'])
-            
-            # Create subplots
-            fig = make_subplots(
-                rows=3, cols=1,
-                subplot_titles=("CPU & Memory Usage", "Processing Performance", "System Status"),
-                shared_xaxes=True,
-                vertical_spacing=0.1
-            )
-            
-            # Plot CPU and Memory usage
-            fig.add_trace(
-                go.Scatter(
-                    x=df['timestamp'],
-                    y=df['cpu_usage'],
-                    mode='lines',
-                    name='CPU Usage (%)',
-                    line=dict(color='#1f77b4')
-                ),
-                row=1, col=1
-            )
-            
-            fig.add_trace(
-                go.Scatter(
-                    x=df['timestamp'],
-                    y=df['memory_usage'] / 1024,  # Convert to GB
-                    mode='lines',
-                    name='Memory Usage (GB)',
-                    line=dict(color='#ff7f0e'),
-                    yaxis='y2'
-                ),
-                row=1, col=1
-            )
-            
-            # Processing performance
-            fig.add_trace(
-                go.Scatter(
-                    x=df['timestamp'],
-                    y=df['frames_processed'],
-                    mode='lines+markers',
-                    name='Frames Processed',
-                    line=dict(color='#2ca02c')
-                ),
-                row=2, col=1
-            )
-            
-            fig.add_trace(
-                go.Scatter(
-                    x=df['timestamp'],
-                    y=df['processing_time'],
-                    mode='lines',
-                    name='Processing Time (ms)',
-                    line=dict(color='#d62728'),
-                    yaxis='y3'
-                ),
-                row=2, col=1
-            )
-            
-            # System status
-            fig.add_trace(
-                go.Scatter(
-                    x=df['timestamp'],
-                    y=df['camera_count'],
-                    mode='lines+markers',
-                    name='Active Cameras',
-                    line=dict(color='#9467bd')
-                ),
-                row=3, col=1
-            )
-            
-            fig.add_trace(
-                go.Scatter(
-                    x=df['timestamp'],
-                    y=df['error_count'],
-                    mode='lines+markers',
-                    name='Errors',
-                    line=dict(color='#e377c2'),
-                    yaxis='y4'
-                ),
-                row=3, col=1
-            )
-            
-            # Update layout
-            fig.update_layout(
-                height=800,
-                title_text="System Performance Metrics",
-                legend=dict(
-                    orientation="h",
-                    yanchor="bottom",
-                    y=1.02,
-                    xanchor="right",
-                    x=1
-                ),
-                yaxis=dict(title="CPU Usage (%)"),
-                yaxis2=dict(
-                    title="Memory (GB)",
-                    overlaying="y",
-                    side="right"
-                ),
-                yaxis3=dict(
-                    title="Processing Time (ms)",
-                    overlaying="y",
-                    side="right"
-                ),
-                yaxis4=dict(
-                    title="Error Count",
-                    overlaying="y",
-                    side="right"
-                )
-            )
-            
             st.plotly_chart(fig, use_container_width=True)
             
             # Raw data table
             with st.expander("View Raw Performance Data"):
-                st.dataframe(df)
+                st.dataframe(pd.DataFrame(metrics))
 
     @staticmethod
     def _create_database_settings_section(db_manager):
@@ -1809,55 +2175,63 @@ class UIComponents:
                 db_manager.max_connections = pool_size
                 st.success(f"Connection pool size updated to {pool_size}")
             
-            # Run VACUUM to optimize database
-            with st.spinner("Optimizing database..."):
-                try:
-                    conn = db_manager.get_connection()
-                    conn.execute("VACUUM")
-                    db_manager.release_connection(conn)
+            # Reclaim free pages in the background so the UI stays responsive
+            if st.session_state.get('db_optimize_future') is None:
+                st.session_state.db_optimize_future = _DB_MAINTENANCE_EXECUTOR.submit(db_manager.optimize_database)
+        
+        # Report on a background optimization started by an earlier run
+        optimize_future = st.session_state.get('db_optimize_future')
+        if optimize_future is not None:
+            if not optimize_future.done():
+                st.info("Optimizing database in the background...")
+            else:
+                st.session_state.db_optimize_future = None
+                if optimize_future.result():
                     st.success("Database optimized successfully")
-                except Exception as e:
-                    st.error(f"Database optimization failed: {str(e)}")
+                else:
+                    st.error("Database optimization failed, see the log for details")
         
         # Database statistics
         with st.expander("Database Statistics", expanded=False):
             try:
-                conn = db_manager.get_connection()
-                cursor = conn.cursor()
-                
-                # Get table statistics
-                tables = ["visibility_metrics", "daily_stats", "weather_data", "events", "performance_metrics"]
-                table_stats = {}
-                
-                for table in tables:
-                    cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                    count = cursor.fetchone()[0]
-                    table_stats[table] = count
-                
-                # Display stats
-                st.markdown("#### Table Row Counts")
-                for table, count in table_stats.items():
-                    st.markdown(f"- **{table}:** {count:,} rows")
-                
-                # Get database size
-                cursor.execute("PRAGMA page_count")
-                page_count = cursor.fetchone()[0]
-                
-                cursor.execute("PRAGMA page_size")
-                page_size = cursor.fetchone()[0]
-                
-                db_size_bytes = page_count * page_size
-                db_size_mb = db_size_bytes / (1024 * 1024)
-                
-                st.markdown(f"**Database Size:** {db_size_mb:.2f} MB")
-                
-                # Get index information
-                cursor.execute("SELECT name FROM sqlite_master WHERE type='index'")
-                indexes = cursor.fetchall()
-                
-                st.markdown(f"**Number of Indexes:** {len(indexes)}")
-                
-                db_manager.release_connection(conn)
+                # One pooled connection for every statistics query, released even on error
+                with db_manager.connection() as conn:
+                    cursor = conn.cursor()
+                    
+                    # Get table statistics; approximate counts come from ANALYZE in one query
+                    table_stats = dict.fromkeys(_DB_TABLES)
+                    try:
+                        cursor.execute(_DB_STAT_COUNTS_SQL, _DB_TABLES)
+                        table_stats.update(cursor.fetchall())
+                    except sqlite3.OperationalError:
+                        pass  # No sqlite_stat1 yet
+                    
+                    # Count any table without statistics exactly, still in a single query
+                    missing = [table for table, count in table_stats.items() if count is None]
+                    if missing:
+                        cursor.execute(" UNION ALL ".join(f"SELECT '{t}', COUNT(*) FROM {t}" for t in missing))
+                        table_stats.update(cursor.fetchall())
+                    
+                    # Display stats; counts from sqlite_stat1 are as of the last optimization
+                    st.markdown("#### Table Row Counts")
+                    for table, count in table_stats.items():
+                        approx = "~" if table not in missing else ""
+                        st.markdown(f"- **{table}:** {approx}{count:,} rows")
+                    if len(missing) < len(table_stats):
+                        st.caption("~ Approximate, as of the last database optimization")
+                    
+                    # Get database size
+                    cursor.execute("SELECT page_count * page_size FROM pragma_page_count(), pragma_page_size()")
+                    db_size_bytes = cursor.fetchone()[0]
+                    db_size_mb = db_size_bytes / (1024 * 1024)
+                    
+                    st.markdown(f"**Database Size:** {db_size_mb:.2f} MB")
+                    
+                    # Get index information
+                    cursor.execute("SELECT name FROM sqlite_master WHERE type='index'")
+                    indexes = cursor.fetchall()
+                    
+                    st.markdown(f"**Number of Indexes:** {len(indexes)}")
                 
             except Exception as e:
                 st.error(f"Failed to retrieve database statistics: {str(e)}")
@@ -2009,30 +2383,14 @@ class UIComponents:
             icon_url = weather_data.get('icon_url')
             if icon_url:
                 try:
-                    # Use st.image with the URL directly
-                    st.image(icon_url, width=100)
+                    # Serve the cached icon bytes instead of the URL
+                    st.image(_fetch_icon(icon_url), width=100)
                 except Exception as e:
-                    st.markdown("### " + {
-                        "Clear": "☀️",
-                        "Clouds": "☁️",
-                        "Rain": "🌧️",
-                        "Snow": "❄️",
-                        "Mist": "🌫️",
-                        "Fog": "🌫️",
-                        "Thunderstorm": "⛈️"
-                    }.get(weather_data.get('condition', 'Unknown').split()[0], "🌤️"))
+                    st.markdown("### " + _CONDITION_EMOJI.get(
+                        weather_data.get('condition', 'Unknown').split()[0], "🌤️"))
             else:
                 # Placeholder icon using emoji
-                st.markdown("### " + {
-                    "Clear": "☀️",
-                    "Clouds": "☁️",
-                    "Rain": "🌧️",
-                    "Drizzle": "🌦️",
-                    "Thunderstorm": "⛈️",
-                    "Snow": "❄️",
-                    "Mist": "🌫️",
-                    "Fog": "🌫️"
-                }.get(weather_data.get('condition', ''), "🌡️"))
+                st.markdown("### " + _CONDITION_EMOJI.get(weather_data.get('condition', ''), "🌡️"))
             
             # Last updated info
             st.caption(f"Last updated: {weather_data.get('last_updated', 'N/A')}")
@@ -2045,30 +2403,22 @@ class UIComponents:
         if 'historical' in weather_data and weather_data['historical']:
             st.subheader("Weather History")
             
-            # Convert to DataFrame for chart
-            hist_data = pd.DataFrame(weather_data['historical'])
+            # Hashable (timestamp, temperature) pairs key the cached chart series
+            historical = weather_data['historical']
+            hist_tuple = tuple((row['timestamp'], row['temperature']) for row in historical)
             
             # Plot temperature history
-            st.line_chart(hist_data.set_index('timestamp')['temperature'])
+            st.line_chart(_weather_hist_series(hist_tuple))
             
             # Show weather history table
             with st.expander("View Weather History Data"):
-                st.dataframe(hist_data)
+                st.dataframe(_weather_hist_table(historical))
         
         # Weather and visibility correlation
         st.subheader("Weather Impact on Visibility")
         
-        # This would be populated with actual data in the real app
-        impact_data = {
-            'Temperature': 'Medium impact - High temperatures can create heat haze',
-            'Humidity': 'High impact - Higher humidity generally reduces visibility',
-            'Precipitation': 'Very high impact - Rain and snow drastically reduce visibility',
-            'Wind': 'Variable impact - Can clear fog but also bring dust and particles',
-            'Fog/Mist': 'Extreme impact - Fog is the primary visibility reducer'
-        }
-        
-        # Create a simple table to display impact
-        for factor, impact in impact_data.items():
+        # Create a simple table to display impact (would be populated with actual data in the real app)
+        for factor, impact in _IMPACT_DATA:
             st.markdown(f"**{factor}:** {impact}")
         
         # Weather-based recommendations
@@ -2122,93 +2472,89 @@ class UIComponents:
             st.warning("No cameras available. Please add cameras in the settings.")
             return
         
-        # Get available cameras
-        cameras = list(st.session_state.camera_managers.keys())
+        # Create grid of cameras; it refreshes on its own cadence without rerunning the tab
+        UIComponents._camera_grid_fragment(tuple(st.session_state.camera_managers))
         
-        # Grid layout options
+        # Grid controls
+        UIComponents._camera_grid_controls_fragment()
+    
+    @staticmethod
+    @st.fragment(run_every=1.0)
+    def _camera_grid_fragment(cameras):
+        """Grid layout picker and live camera grid, rerun every second while the Camera Grid tab is selected"""
+        # Grid layout options; rendered on every run so the widget keeps its state while the tab is hidden
         st.subheader("Grid Layout")
         layout_options = ["Auto", "1x1", "2x2", "3x3", "4x4"]
         layout = st.selectbox(
             "Select Grid Layout",
             options=layout_options,
             index=0,
-            help="Choose grid layout for camera views"
+            help="Choose grid layout for camera views",
+            key="grid_layout_select"
         )
         
+        # Skip status polling while another tab is selected; selecting this tab reruns the app
+        selected_tab = st.session_state.get('main_tabs')
+        if selected_tab is not None and selected_tab != _TAB_LABELS[7]:
+            return
+        
+        camera_count = len(cameras)
+        
         # Determine grid dimensions based on layout and camera count
         if layout == "Auto":
-            cam_count = len(cameras)
-            if cam_count <= 1:
+            if camera_count <= 1:
                 rows, cols = 1, 1
-            elif cam_count <= 4:
+            elif camera_count <= 4:
                 rows, cols = 2, 2
-            elif cam_count <= 9:
+            elif camera_count <= 9:
                 rows, cols = 3, 3
             else:
                 rows, cols = 4, 4
         else:
             rows, cols = map(int, layout.split('x'))
         
-        # Create grid of cameras
         st.subheader("Live Camera Grid")
         
-        for r in range(rows):
-            row_cols = st.columns(cols)
-            for c in range(cols):
-                idx = r * cols + c
-                with row_cols[c]:
-                    if idx < len(cameras):
-                        cam_name = cameras[idx]
-                        st.markdown(f"**{cam_name}**")
-                        
-                        # Get camera status info
-                        camera_manager = st.session_state.camera_managers[cam_name]
-                        status = camera_manager.get_status() if hasattr(camera_manager, 'get_status') else {}
-                        
-                        # Show status indicator
-                        if status.get('connected', False):
-                            st.success("Connected")
-                            
-                            # Display placeholder image or frame
-                            # In an actual app, this would show a real camera frame
-                            placeholder = st.empty()
-                            placeholder.image(
-                                "https://via.placeholder.com/640x480.png?text=Camera+Feed",
-                                caption=f"Camera: {cam_name}",
-                                use_column_width=True
-                            )
-                            
-                            # Show summary metrics
-                            metrics_col1, metrics_col2 = st.columns(2)
-                            with metrics_col1:
-                                st.metric("Visibility", f"{status.get('visibility_score', 'N/A')}%")
-                            with metrics_col2:
-                                st.metric("Status", status.get('visibility_status', 'Unknown'))
-                        else:
-                            st.error("Disconnected")
-                            st.image(
-                                "https://via.placeholder.com/640x480.png?text=Camera+Disconnected",
-                                caption=f"Camera: {cam_name}",
-                                use_column_width=True
-                            )
-                    else:
-                        st.markdown("*Empty slot*")
-        
-        # Grid controls
+        # Refresh All drops the status snapshot; the fragment reruns on the click by itself
+        if st.button("Refresh All", key="grid_refresh_all_btn"):
+            st.session_state.pop('_grid_statuses', None)
+        
+        # Fetch every camera's status in one pass, shared by reruns within a second
+        camera_managers = st.session_state.camera_managers
+        statuses = _collect_statuses(cameras, camera_managers)
+        
+        # Only rebuild the grid markup when the layout or a rendered status field changed
+        grid_key = (cols, rows * cols, tuple(
+            (cam_name, statuses[cam_name].get('connected', False),
+             statuses[cam_name].get('visibility_score'), statuses[cam_name].get('visibility_status'))
+            for cam_name in cameras[:rows * cols]
+        ))
+        if st.session_state.get('_grid_key') != grid_key:
+            # Render the whole grid as one HTML block instead of several elements per cell
+            cells = "".join(
+                _grid_cell_html(cameras[idx], statuses[cameras[idx]]) if idx < camera_count
+                else '<div class="camera-cell"><em>Empty slot</em></div>'
+                for idx in range(rows * cols)
+            )
+            st.session_state._grid_key = grid_key
+            st.session_state._grid_html = (f'{_CAMERA_GRID_CSS}<div class="camera-grid" '
+                                           f'style="grid-template-columns: repeat({cols}, 1fr);">{cells}</div>')
+        st.markdown(st.session_state._grid_html, unsafe_allow_html=True)
+    
+    @staticmethod
+    @st.fragment
+    def _camera_grid_controls_fragment():
+        """Grid control buttons and preset saving, rerun on their own"""
         st.subheader("Grid Controls")
         
-        col1, col2, col3 = st.columns(3)
+        col1, col2 = st.columns(2)
         
         with col1:
-            if st.button("Refresh All", use_container_width=True, key="grid_refresh_all_btn"):
-                st.rerun()
-        
-        with col2:
             if st.button("Reconnect All", use_container_width=True, key="grid_reconnect_all_btn"):
                 # In a real app, this would try to reconnect all cameras
                 st.info("Attempting to reconnect all cameras...")
                 
-        with col3:
+        with col2:
             # Capture snapshot from all cameras
             if st.button("Capture Snapshots", use_container_width=True, key="grid_capture_all_btn"):
                 # In a real app, this would capture snapshots from all cameras
@@ -2223,6 +2569,7 @@ class UIComponents:
                 st.success(f"Grid layout saved as '{preset_name}'")
     
     @staticmethod
+    @st.fragment
     def create_dashboard_overview():
         """Create the dashboard overview tab with overall system status"""
         st.header("📋 Dashboard Overview")
@@ -2272,23 +2619,23 @@ class UIComponents:
         st.subheader("Camera Status Summary")
         
         if 'camera_managers' in st.session_state and st.session_state.camera_managers:
-            # Create status dataframe
-            camera_data = []
+            # Create status dataframe column by column
+            camera_data = {'Camera': [], 'Status': [], 'Visibility': [], 'Condition': [], 'Last Updated': []}
             
             for cam_name, manager in st.session_state.camera_managers.items():
+                # One status call per manager
                 status = manager.get_status() if hasattr(manager, 'get_status') else {}
-                camera_data.append({
-                    'Camera': cam_name,
-                    'Status': 'Connected' if status.get('connected', False) else 'Disconnected',
-                    'Visibility': f"{status.get('visibility_score', 0):.1f}%",
-                    'Condition': status.get('visibility_status', 'Unknown'),
-                    'Last Updated': status.get('last_update', 'N/A')
-                })
+                camera_data['Camera'].append(cam_name)
+                camera_data['Status'].append('Connected' if status.get('connected', False) else 'Disconnected')
+                camera_data['Visibility'].append(float(status.get('visibility_score', 0.0)))
+                camera_data['Condition'].append(status.get('visibility_status', 'Unknown'))
+                camera_data['Last Updated'].append(status.get('last_update', 'N/A'))
             
             # Display as dataframe
-            if camera_data:
+            if camera_data['Camera']:
                 df = pd.DataFrame(camera_data)
-                st.dataframe(df, use_container_width=True)
+                # Visibility stays numeric; the frontend formats it
+                st.dataframe(df, use_container_width=True, column_config=_CAMERA_SUMMARY_COLUMNS)
             else:
                 st.info("No camera data available")
         else:
@@ -2298,17 +2645,9 @@ class UIComponents:
         st.subheader("Recent Events")
         
         # Placeholder for recent events - in a real app would be fetched from database
-        events = [
-            {"timestamp": "2023-04-30 14:23:45", "camera": "Front Gate", "type": "Visibility Decrease", "details": "Visibility dropped to 45%"},
-            {"timestamp": "2023-04-30 12:15:30", "camera": "Back Yard", "type": "Camera Disconnected", "details": "Connection lost"},
-            {"timestamp": "2023-04-30 10:05:12", "camera": "Driveway", "type": "Visibility Increase", "details": "Visibility improved to 92%"},
-            {"timestamp": "2023-04-30 08:45:22", "camera": "Front Gate", "type": "Weather Change", "details": "Rain detected"}
-        ]
-        
-        if events:
+        if _MOCK_EVENTS:
             # Display events as dataframe
-            events_df = pd.DataFrame(events)
-            st.dataframe(events_df, use_container_width=True)
+            st.dataframe(_events_df(_MOCK_EVENTS), use_container_width=True)
         else:
             st.info("No recent events")
         
@@ -2336,13 +2675,8 @@ class UIComponents:
         st.subheader("Active Alerts")
         
         # Placeholder for system alerts - in a real app would be fetched from database
-        alerts = [
-            {"severity": "High", "message": "Camera 'Back Yard' disconnected for more than 30 minutes", "time": "14:45:22"},
-            {"severity": "Medium", "message": "Disk usage above 70%", "time": "13:30:15"}
-        ]
-        
-        if alerts:
-            for alert in alerts:
+        if _MOCK_ALERTS:
+            for alert in _MOCK_ALERTS:
                 if alert["severity"] == "High":
                     st.error(f"{alert['time']} - {alert['message']}")
                 elif alert["severity"] == "Medium":
@@ -2354,7 +2688,18 @@ class UIComponents:
         
         # Allow refreshing the dashboard
         if st.button("Refresh Dashboard", key="refresh_dashboard_btn"):
-            st.rerun()
+            st.rerun(scope="fragment")
+
+    @staticmethod
+    def _resolve_camera_name(camera_manager):
+        """Return the camera's name, falling back to its camera ID (or "camera") if get_name is unavailable"""
+        camera_name = getattr(camera_manager, 'camera_id', "camera")
+        try:
+            if hasattr(camera_manager, 'get_name'):
+                camera_name = camera_manager.get_name()
+        except Exception as e:
+            logger.warning(f"Could not get camera name: {str(e)}")
+        return camera_name
 
     @staticmethod
     def create_recordings_tab(camera_manager):
@@ -2367,18 +2712,10 @@ class UIComponents:
             return
         
         # Get recordings path - in real app would come from the camera manager
-        # Use camera ID as fallback if get_name is not available
-        camera_name = camera_manager.camera_id if hasattr(camera_manager, 'camera_id') else "camera"
-        try:
-            if hasattr(camera_manager, 'get_name'):
-                camera_name = camera_manager.get_name()
-        except Exception as e:
-            st.warning(f"Could not get camera name: {str(e)}")
-            
-        recordings_path = os.path.join(RECORDINGS_DIR, camera_name)
+        camera_name = UIComponents._resolve_camera_name(camera_manager)
         
-        # Create directory if not exists
-        os.makedirs(recordings_path, exist_ok=True)
+        # Create directory if not exists (once per process)
+        recordings_path = _ensure_dir(RECORDINGS_DIR, camera_name)
         
         # Recording settings
         st.subheader("Recording Settings")
@@ -2449,29 +2786,31 @@ class UIComponents:
         # Get list of recordings (in real app would come from camera manager)
         recordings = []
         
-        # Check if directory exists and list files
+        # Check if directory exists and list files; scandir yields paths and stats without extra joins
         if os.path.exists(recordings_path):
-            for file in os.listdir(recordings_path):
-                if file.endswith(('.mp4', '.avi', '.mkv')):
-                    file_path = os.path.join(recordings_path, file)
+            with os.scandir(recordings_path) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(('.mp4', '.avi', '.mkv')):
+                        continue
                     # Get file stats
-                    stats = os.stat(file_path)
+                    stats = entry.stat()
                     # Create recording entry
                     recordings.append({
-                        'filename': file,
-                        'path': file_path,
-                        'date': datetime.fromtimestamp(stats.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
-                        'size': f"{stats.st_size / (1024 * 1024):.2f} MB",
+                        'filename': entry.name,
+                        'path': entry.path,
+                        'mtime': datetime.fromtimestamp(stats.st_mtime),
+                        'size_mb': stats.st_size / (1024 * 1024),
                         'duration': '10:00'  # In a real app, this would be extracted from the video
                     })
         
-        # Sort recordings by date (newest first)
-        recordings.sort(key=lambda x: x['date'], reverse=True)
+        # Sort recordings by modification time (newest first)
+        recordings.sort(key=itemgetter('mtime'), reverse=True)
         
         if recordings:
             # Create a table of recordings
             recordings_df = pd.DataFrame(recordings)
-            st.dataframe(recordings_df[['filename', 'date', 'size', 'duration']], use_container_width=True)
+            st.dataframe(recordings_df[['filename', 'mtime', 'size_mb', 'duration']], use_container_width=True,
+                         column_config=_RECORDING_COLUMNS)
             
             # Select recording to play
             selected_recording = st.selectbox(
@@ -2485,7 +2824,7 @@ class UIComponents:
             
             if selected_rec:
                 # Recording details
-                st.markdown(f"**Date:** {selected_rec['date']} | **Size:** {selected_rec['size']} | **Duration:** {selected_rec['duration']}")
+                st.markdown(f"**Date:** {selected_rec['mtime']:%Y-%m-%d %H:%M:%S} | **Size:** {selected_rec['size_mb']:.2f} MB | **Duration:** {selected_rec['duration']}")
                 
                 # In real app, this would play the video
                 st.video(selected_rec['path'])
@@ -2516,18 +2855,10 @@ class UIComponents:
             return
         
         # Get highlights path - in real app would come from the camera manager
-        # Use camera ID as fallback if get_name is not available
-        camera_name = camera_manager.camera_id if hasattr(camera_manager, 'camera_id') else "camera"
-        try:
-            if hasattr(camera_manager, 'get_name'):
-                camera_name = camera_manager.get_name()
-        except Exception as e:
-            st.warning(f"Could not get camera name: {str(e)}")
-            
-        highlights_path = os.path.join(HIGHLIGHTS_DIR, camera_name)
+        camera_name = UIComponents._resolve_camera_name(camera_manager)
         
-        # Create directory if not exists
-        os.makedirs(highlights_path, exist_ok=True)
+        # Create directory if not exists (once per process)
+        _ensure_dir(HIGHLIGHTS_DIR, camera_name)
         
         # Highlight settings
         st.subheader("Highlight Settings")
@@ -2604,67 +2935,38 @@ class UIComponents:
         # List highlights
         st.subheader("Highlight Events")
         
-        # In a real app, these would be loaded from storage or database
-        # Mock data for demonstration
-        highlights = [
-            {
-                'id': '1',
-                'date': '2023-04-30 14:23:45',
-                'type': 'Visibility Decrease',
-                'description': 'Visibility dropped from 85% to 45%',
-                'duration': '00:30',
-                'thumbnail': 'https://via.placeholder.com/320x240.png?text=Visibility+Decrease',
-                'video_path': ''
-            },
-            {
-                'id': '2',
-                'date': '2023-04-29 12:15:30',
-                'type': 'Weather Change',
-                'description': 'Rain detected, visibility affected',
-                'duration': '00:45',
-                'thumbnail': 'https://via.placeholder.com/320x240.png?text=Weather+Change',
-                'video_path': ''
-            },
-            {
-                'id': '3',
-                'date': '2023-04-28 10:05:12',
-                'type': 'Visibility Increase',
-                'description': 'Visibility improved from 40% to 92%',
-                'duration': '00:20',
-                'thumbnail': 'https://via.placeholder.com/320x240.png?text=Visibility+Increase',
-                'video_path': ''
-            }
-        ]
-        
-        # Apply filters
-        if event_type != "All Events":
-            highlights = [h for h in highlights if h['type'] == event_type]
-            
-        start_datetime = datetime.combine(start_date, datetime.min.time())
-        end_datetime = datetime.combine(end_date, datetime.max.time())
-        
-        highlights = [h for h in highlights if start_datetime <= datetime.strptime(h['date'], '%Y-%m-%d %H:%M:%S') <= end_datetime]
+        # Load and filter highlights, cached across reruns
+        highlights = _filter_highlights(
+            _load_highlights(camera_name),
+            datetime.combine(start_date, datetime.min.time()),
+            datetime.combine(end_date, datetime.max.time()),
+            event_type
+        )
         
         if highlights:
-            # Display highlights as a grid
-            for i in range(0, len(highlights), 3):
-                row_highlights = highlights[i:i+3]
-                cols = st.columns(len(row_highlights))
-                
-                for j, (col, highlight) in enumerate(zip(cols, row_highlights)):
-                    with col:
-                        st.image(highlight['thumbnail'], use_column_width=True)
-                        st.markdown(f"**{highlight['type']}**")
-                        st.caption(highlight['date'])
-                        st.markdown(highlight['description'])
-                        
-                        # In a real app, this would play the video
-                        if st.button("View", key=f"view_{highlight['id']}"):
-                            st.session_state.selected_highlight = highlight
+            # Display all highlights as a single HTML grid
+            st.markdown(_highlight_grid_html(highlights), unsafe_allow_html=True)
+            
+            # One selection widget drives the detail view
+            by_id = {h['id']: h for h in highlights}
+            if st.session_state.get('selected_highlight_id') not in by_id:
+                st.session_state.selected_highlight_id = None
+            st.selectbox(
+                "View highlight",
+                options=list(by_id),
+                format_func=lambda i: f"{by_id[i]['date']} - {by_id[i]['type']}",
+                index=None,
+                placeholder="Select a highlight",
+                key="selected_highlight_id"
+            )
+            
+            notice = st.session_state.pop('highlight_notice', None)
+            if notice:
+                st.error(notice)
             
             # Display selected highlight details
-            if 'selected_highlight' in st.session_state and st.session_state.selected_highlight:
-                highlight = st.session_state.selected_highlight
+            if st.session_state.selected_highlight_id is not None:
+                highlight = by_id[st.session_state.selected_highlight_id]
                 
                 st.subheader(f"Highlight: {highlight['type']}")
                 st.markdown(f"**Date:** {highlight['date']} | **Duration:** {highlight['duration']}")
@@ -2683,11 +2985,12 @@ class UIComponents:
                         st.success(f"Downloading highlight from {highlight['date']}...")
                 
                 with col2:
-                    if st.button("Delete Highlight", key="highlight_delete_btn"):
-                        # In a real app, this would delete the highlight
-                        st.error(f"Deleted highlight from {highlight['date']}")
-                        if 'selected_highlight' in st.session_state:
-                            del st.session_state.selected_highlight
+                    st.button(
+                        "Delete Highlight",
+                        key="highlight_delete_btn",
+                        on_click=_delete_selected_highlight,
+                        args=(highlight['date'],)
+                    )
         else:
             st.info("No highlights found matching the current filters")
 
@@ -2741,60 +3044,7 @@ class UIComponents:
         
         # Generate mock historical data
         # In a real app, this would come from the database
-        
-        # Generate date range
-        date_range = []
-        current_date = start_date
-        while current_date <= end_date:
-            if interval == "Hourly":
-                for hour in range(0, 24, 2):  # Every 2 hours
-                    date_range.append(datetime.combine(current_date, datetime.min.time()) + timedelta(hours=hour))
-            elif interval == "Daily":
-                date_range.append(datetime.combine(current_date, datetime.min.time()))
-            elif interval == "Weekly":
-                if current_date.weekday() == 0:  # Monday
-                    date_range.append(datetime.combine(current_date, datetime.min.time()))
-            current_date += timedelta(days=1)
-        
-        # Generate data
-        import random
-        data = []
-        
-        base_visibility = 80
-        base_brightness = 150
-        base_contrast = 60
-        base_edge = 70
-        
-        for date in date_range:
-            # Add some randomness and trends
-            time_factor = (date - datetime.combine(start_date, datetime.min.time())).total_seconds() / (24 * 3600)
-            daily_cycle = np.sin(time_factor * np.pi / 12) * 20  # Daily cycle
-            
-            # Create some events
-            if random.random() < 0.1:  # 10% chance of event
-                event_impact = -40 if random.random() < 0.7 else 20  # More likely to be negative events
-            else:
-                event_impact = 0
-                
-            visibility = max(0, min(100, base_visibility + daily_cycle + event_impact + random.uniform(-10, 10)))
-            brightness = max(0, min(255, base_brightness + daily_cycle + event_impact + random.uniform(-20, 20)))
-            contrast = max(0, min(100, base_contrast + daily_cycle/3 + event_impact/2 + random.uniform(-5, 5)))
-            edge = max(0, min(100, base_edge + daily_cycle/3 + event_impact/2 + random.uniform(-10, 10)))
-            
-            # Weather correlation is stronger during events
-            weather_corr = abs(event_impact) / 20 + random.uniform(0, 0.7)
-            
-            data.append({
-                'timestamp': date,
-                'visibility': visibility,
-                'brightness': brightness,
-                'contrast': contrast,
-                'edge': edge,
-                'weather_correlation': min(1.0, weather_corr)
-            })
-        
-        # Convert to DataFrame
-        df = pd.DataFrame(data)
+        df = _mock_historical_df(start_date, end_date, interval)
         
         # Display data
         if not df.empty and selected_metrics:
@@ -2812,12 +3062,14 @@ class UIComponents:
             # Create plot
             fig = go.Figure()
             
+            timestamps = df['timestamp'].to_numpy()
             for metric in selected_metrics:
                 if metric in metric_map:
                     column = metric_map[metric]
+                    x, y = _lttb(timestamps, df[column].to_numpy(), _HISTORY_MAX_POINTS)
                     fig.add_trace(go.Scatter(
-                        x=df['timestamp'],
-                        y=df[column],
+                        x=x,
+                        y=y,
                         mode='lines+markers',
                         name=metric
                     ))
@@ -2836,21 +3088,15 @@ class UIComponents:
             # Summary statistics
             st.subheader("Summary Statistics")
             
-            summary_data = []
-            for metric in selected_metrics:
-                if metric in metric_map:
-                    column = metric_map[metric]
-                    summary_data.append({
-                        'Metric': metric,
-                        'Average': f"{df[column].mean():.2f}",
-                        'Minimum': f"{df[column].min():.2f}",
-                        'Maximum': f"{df[column].max():.2f}",
-                        'Standard Deviation': f"{df[column].std():.2f}"
-                    })
-            
-            if summary_data:
-                summary_df = pd.DataFrame(summary_data)
-                st.dataframe(summary_df, use_container_width=True)
+            # One aggregation pass over the selected columns
+            shown = [m for m in selected_metrics if m in metric_map]
+            if shown:
+                summary_df = (df[[metric_map[m] for m in shown]]
+                              .agg(['mean', 'min', 'max', 'std']).T
+                              .astype(float).round(2))
+                summary_df.columns = ['Average', 'Minimum', 'Maximum', 'Standard Deviation']
+                summary_df.index = pd.Index(shown, name='Metric')
+                st.dataframe(summary_df.reset_index(), use_container_width=True)
             
             # Raw data view
             with st.expander("View Raw Data"):
@@ -6,11 +6,56 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from ..config.settings import DATA_DIR
 import time
+import threading
+import atexit
+from collections import deque
 import json
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Queued samples are written every _FLUSH_INTERVAL seconds, or sooner once _FLUSH_MAX_ROWS pile up
+_FLUSH_INTERVAL = 2.0
+_FLUSH_MAX_ROWS = 500
+
+# Per-sample metrics row
+_INSERT_METRICS_SQL = '''
+INSERT OR REPLACE INTO camera_metrics (camera_id, timestamp, brightness, contrast, sharpness, visibility_score, visibility_status)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Keeps daily_stats current in-database: each inserted metrics row is folded into its camera's day
+_DAILY_STATS_TRIGGER_SQL = '''
+CREATE TRIGGER trg_daily_stats AFTER INSERT ON camera_metrics
+BEGIN
+    INSERT INTO daily_stats (
+        camera_id, date, min_brightness, max_brightness, avg_brightness,
+        min_visibility_score, max_visibility_score, avg_visibility_score,
+        poor_visibility_count, moderate_visibility_count, good_visibility_count, total_samples
+    ) VALUES (
+        NEW.camera_id, date(NEW.timestamp), NEW.brightness, NEW.brightness, NEW.brightness,
+        NEW.visibility_score, NEW.visibility_score, NEW.visibility_score,
+        NEW.visibility_status = 'Poor', NEW.visibility_status = 'Moderate', NEW.visibility_status = 'Good', 1
+    )
+    ON CONFLICT(camera_id, date) DO UPDATE SET
+        min_brightness = min(min_brightness, excluded.min_brightness),
+        max_brightness = max(max_brightness, excluded.max_brightness),
+        avg_brightness = (avg_brightness * total_samples + excluded.avg_brightness) / (total_samples + 1),
+        min_visibility_score = min(min_visibility_score, excluded.min_visibility_score),
+        max_visibility_score = max(max_visibility_score, excluded.max_visibility_score),
+        avg_visibility_score = (avg_visibility_score * total_samples + excluded.avg_visibility_score) / (total_samples + 1),
+        poor_visibility_count = poor_visibility_count + excluded.poor_visibility_count,
+        moderate_visibility_count = moderate_visibility_count + excluded.moderate_visibility_count,
+        good_visibility_count = good_visibility_count + excluded.good_visibility_count,
+        total_samples = total_samples + 1;
+END
+'''
+
+# In-memory visibility history: one row per numeric field, one column per sample, kept as a ring of the
+# last 1000; any other keys (visibility_status, ...) sit in a parallel object column
+_VISIBILITY_FIELDS = ('timestamp', 'visibility_score', 'brightness', 'contrast')
+_VISIBILITY_CAPACITY = 1000
+
 class AnalyticsManager:
     """Analytics manager for storing and retrieving camera metrics"""
     
@@ -21,6 +66,8 @@ class AnalyticsManager:
         if cls._instance is None:
             cls._instance = super(AnalyticsManager, cls).__new__(cls)
             cls._instance.db_path = DATA_DIR / "analytics.db"
+            cls._instance.data_dir = DATA_DIR
+            cls._instance.visibility_data = {}
             cls._instance._init_db()
         return cls._instance
     
@@ -31,10 +78,15 @@ class AnalyticsManager:
             if hasattr(self, '_db_initialized') and self._db_initialized:
                 return
                 
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
+            # One long-lived connection serves every call; writes are serialized by _db_lock
+            self._db_lock = threading.Lock()
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute("PRAGMA synchronous = NORMAL")
+            cursor = self._conn.cursor()
             
-            # Create camera_metrics table
+            # Create camera_metrics table; UNIQUE(camera_id, timestamp) also serves as the
+            # index for per-camera timestamp range scans in get_historical_stats
             cursor.execute('''
             CREATE TABLE IF NOT EXISTS camera_metrics (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -76,8 +128,16 @@ class AnalyticsManager:
             )
             ''')
             
-            conn.commit()
-            conn.close()
+            # Recreate the daily_stats trigger so it always matches the current schema
+            cursor.execute("DROP TRIGGER IF EXISTS trg_daily_stats")
+            cursor.execute(_DAILY_STATS_TRIGGER_SQL)
+            
+            # Samples are buffered here and written behind by the flush thread
+            self._queue = deque()
+            self._lock = threading.Lock()
+            self._flush_event = threading.Event()
+            threading.Thread(target=self._flush_loop, name="analytics-flush", daemon=True).start()
+            atexit.register(self._flush)
             
             # Mark as initialized to prevent multiple initializations
             self._db_initialized = True
@@ -87,156 +147,71 @@ class AnalyticsManager:
             logger.error(f"Error initializing database: {str(e)}")
     
     def update_daily_stats(self, camera_id, brightness=0, contrast=0, visibility_score=0, visibility_status="Unknown"):
-        """Update daily statistics for camera"""
+        """Queue a sample for the metrics table and daily statistics of a camera"""
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._lock:
+            self._queue.append((camera_id, timestamp, brightness, contrast, 0, visibility_score, visibility_status))
+            if len(self._queue) >= _FLUSH_MAX_ROWS:
+                self._flush_event.set()
+    
+    def _flush_loop(self):
+        """Write queued samples every _FLUSH_INTERVAL seconds, or when the queue fills"""
+        while True:
+            self._flush_event.wait(_FLUSH_INTERVAL)
+            self._flush_event.clear()
+            self._flush()
+    
+    def _flush(self):
+        """Write all queued samples in one transaction; the trigger keeps daily_stats in step"""
+        with self._lock:
+            rows = list(self._queue)
+            self._queue.clear()
+        if not rows:
+            return
+        
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
-            
-            # Get current date and timestamp
-            now = datetime.now()
-            today = now.strftime("%Y-%m-%d")
-            timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
-            
-            # Insert current metrics
-            cursor.execute('''
-            INSERT OR REPLACE INTO camera_metrics (camera_id, timestamp, brightness, contrast, sharpness, visibility_score, visibility_status)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (camera_id, timestamp, brightness, contrast, 0, visibility_score, visibility_status))
-            
-            # Update daily stats
-            # First, check if entry exists for today
-            cursor.execute('''
-            SELECT id FROM daily_stats WHERE camera_id = ? AND date = ?
-            ''', (camera_id, today))
-            
-            result = cursor.fetchone()
-            
-            if result:
-                # Update existing entry, safely handling columns that might be missing
-                try:
-                    cursor.execute('''
-                    UPDATE daily_stats SET
-                        min_brightness = CASE WHEN min_brightness > ? OR min_brightness IS NULL THEN ? ELSE min_brightness END,
-                        max_brightness = CASE WHEN max_brightness < ? OR max_brightness IS NULL THEN ? ELSE max_brightness END,
-                        avg_brightness = (avg_brightness * total_samples + ?) / (total_samples + 1),
-                        min_visibility_score = CASE WHEN min_visibility_score > ? OR min_visibility_score IS NULL THEN ? ELSE min_visibility_score END,
-                        max_visibility_score = CASE WHEN max_visibility_score < ? OR max_visibility_score IS NULL THEN ? ELSE max_visibility_score END,
-                        avg_visibility_score = (avg_visibility_score * total_samples + ?) / (total_samples + 1),
-                        poor_visibility_count = poor_visibility_count + CASE WHEN ? = 'Poor' THEN 1 ELSE 0 END,
-                        moderate_visibility_count = moderate_visibility_count + CASE WHEN ? = 'Moderate' THEN 1 ELSE 0 END,
-                        good_visibility_count = good_visibility_count + CASE WHEN ? = 'Good' THEN 1 ELSE 0 END,
-                        total_samples = total_samples + 1
-                    WHERE camera_id = ? AND date = ?
-                    ''', (
-                        brightness, brightness,
-                        brightness, brightness,
-                        brightness,
-                        visibility_score, visibility_score,
-                        visibility_score, visibility_score,
-                        visibility_score,
-                        visibility_status, visibility_status, visibility_status,
-                        camera_id, today
-                    ))
-                except sqlite3.OperationalError as e:
-                    # If error occurs, use a simpler update that avoids missing columns
-                    logger.warning(f"Using fallback update method due to: {str(e)}")
-                    cursor.execute('''
-                    UPDATE daily_stats SET
-                        min_brightness = CASE WHEN min_brightness > ? OR min_brightness IS NULL THEN ? ELSE min_brightness END,
-                        max_brightness = CASE WHEN max_brightness < ? OR max_brightness IS NULL THEN ? ELSE max_brightness END,
-                        avg_brightness = (avg_brightness * total_samples + ?) / (total_samples + 1),
-                        poor_visibility_count = poor_visibility_count + CASE WHEN ? = 'Poor' THEN 1 ELSE 0 END,
-                        moderate_visibility_count = moderate_visibility_count + CASE WHEN ? = 'Moderate' THEN 1 ELSE 0 END,
-                        good_visibility_count = good_visibility_count + CASE WHEN ? = 'Good' THEN 1 ELSE 0 END,
-                        total_samples = total_samples + 1
-                    WHERE camera_id = ? AND date = ?
-                    ''', (
-                        brightness, brightness,
-                        brightness, brightness,
-                        brightness,
-                        visibility_status, visibility_status, visibility_status,
-                        camera_id, today
-                    ))
-            else:
-                # Create new entry
-                poor_count = 1 if visibility_status == 'Poor' else 0
-                moderate_count = 1 if visibility_status == 'Moderate' else 0
-                good_count = 1 if visibility_status == 'Good' else 0
-                
+            with self._db_lock:
+                self._conn.execute("BEGIN")
                 try:
-                    cursor.execute('''
-                    INSERT INTO daily_stats (
-                        camera_id, date, min_brightness, max_brightness, avg_brightness,
-                        min_visibility_score, max_visibility_score, avg_visibility_score,
-                        poor_visibility_count, moderate_visibility_count, good_visibility_count, total_samples
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        camera_id, today, brightness, brightness, brightness,
-                        visibility_score, visibility_score, visibility_score,
-                        poor_count, moderate_count, good_count, 1
-                    ))
-                except sqlite3.OperationalError as e:
-                    # If error occurs, use a simpler insert that avoids missing columns
-                    logger.warning(f"Using fallback insert method due to: {str(e)}")
-                    cursor.execute('''
-                    INSERT INTO daily_stats (
-                        camera_id, date, min_brightness, max_brightness, avg_brightness,
-                        poor_visibility_count, moderate_visibility_count, good_visibility_count, total_samples
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        camera_id, today, brightness, brightness, brightness,
-                        poor_count, moderate_count, good_count, 1
-                    ))
+                    self._conn.executemany(_INSERT_METRICS_SQL, rows)
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
             
-            conn.commit()
-            conn.close()
-            logger.info(f"Updated daily stats for camera {camera_id}")
+            logger.debug(f"Flushed {len(rows)} analytics samples")
         except Exception as e:
             logger.error(f"Error updating daily stats: {str(e)}")
-            if 'conn' in locals() and conn:
-                conn.close()
     
     def get_historical_stats(self, camera_id, start_date, end_date):
         """Get historical statistics for camera"""
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
-            
             # Format dates
             start_date_str = start_date.strftime("%Y-%m-%d")
             end_date_str = end_date.strftime("%Y-%m-%d")
             
-            # Query metrics within date range
-            cursor.execute('''
-            SELECT timestamp, brightness, visibility_score, visibility_status
-            FROM camera_metrics
-            WHERE camera_id = ? AND timestamp BETWEEN ? AND ?
-            ORDER BY timestamp ASC
-            ''', (camera_id, f"{start_date_str} 00:00:00", f"{end_date_str} 23:59:59"))
+            # Write out anything still queued so the query sees it
+            self._flush()
             
-            results = cursor.fetchall()
-            conn.close()
+            # Query metrics within date range, parsing timestamps column-wise
+            with self._db_lock:
+                df = pd.read_sql_query('''
+                SELECT timestamp, brightness, visibility_score, visibility_status
+                FROM camera_metrics
+                WHERE camera_id = ? AND timestamp BETWEEN ? AND ?
+                ORDER BY timestamp ASC
+                ''', self._conn,
+                    params=(camera_id, f"{start_date_str} 00:00:00", f"{end_date_str} 23:59:59"),
+                    parse_dates={'timestamp': "%Y-%m-%d %H:%M:%S"})
             
-            if not results:
+            if df.empty:
                 return {}
             
-            # Process results
-            timestamps = []
-            brightness_values = []
-            visibility_scores = []
-            visibility_statuses = []
-            
-            for row in results:
-                timestamps.append(datetime.strptime(row[0], "%Y-%m-%d %H:%M:%S"))
-                brightness_values.append(row[1])
-                visibility_scores.append(row[2])
-                visibility_statuses.append(row[3])
-            
             return {
-                'timestamps': timestamps,
-                'brightness_values': brightness_values,
-                'visibility_scores': visibility_scores,
-                'visibility_statuses': visibility_statuses
+                'timestamps': df['timestamp'].to_numpy(),
+                'brightness_values': df['brightness'].to_numpy(),
+                'visibility_scores': df['visibility_score'].to_numpy(),
+                'visibility_statuses': df['visibility_status'].to_numpy()
             }
         except Exception as e:
             logger.error(f"Error retrieving historical stats: {str(e)}")
@@ -244,73 +219,102 @@ class AnalyticsManager:
 
     def add_visibility_data(self, camera_id, data):
         """Add visibility data for a camera"""
-        if camera_id not in self.visibility_data:
-            self.visibility_data[camera_id] = []
+        buf = self.visibility_data.get(camera_id)
+        if buf is None:
+            buf = self.visibility_data[camera_id] = {
+                'values': np.zeros((len(_VISIBILITY_FIELDS), _VISIBILITY_CAPACITY)),
+                'extra': np.empty(_VISIBILITY_CAPACITY, dtype=object),
+                'n': 0,
+                'unsaved': []
+            }
         
         # Add timestamp if not already present
         if 'timestamp' not in data:
             data['timestamp'] = time.time()
             
-        # Add to memory
-        self.visibility_data[camera_id].append(data)
+        # Write into the next ring slot, overwriting the oldest point once full
+        slot = buf['n'] % _VISIBILITY_CAPACITY
+        buf['values'][:, slot] = [data.get(field, 0) for field in _VISIBILITY_FIELDS]
+        buf['extra'][slot] = {key: value for key, value in data.items() if key not in _VISIBILITY_FIELDS}
+        buf['n'] += 1
         
-        # Limit data in memory (keep last 1000 points)
-        if len(self.visibility_data[camera_id]) > 1000:
-            self.visibility_data[camera_id] = self.visibility_data[camera_id][-1000:]
+        # Keep the record as given until the next checkpoint writes it out
+        buf['unsaved'].append(data)
             
         # Save to disk periodically (every 50 data points)
-        if len(self.visibility_data[camera_id]) % 50 == 0:
+        if buf['n'] % 50 == 0:
             self._save_data(camera_id)
     
-    def get_visibility_data(self, camera_id, limit=100, time_range=None):
-        """Get visibility data for a camera"""
-        if camera_id not in self.visibility_data:
-            return []
-            
-        data = self.visibility_data[camera_id]
+    def _visibility_window(self, camera_id, limit, time_range=None):
+        """Return a camera's buffer and the ring slots of its last `limit` points
+        (within time_range seconds, if given), oldest first"""
+        buf = self.visibility_data.get(camera_id)
+        if buf is None:
+            return None, np.empty(0, dtype=np.intp)
+        
+        # Unroll the ring oldest-first
+        n = buf['n']
+        if n > _VISIBILITY_CAPACITY:
+            slots = (np.arange(_VISIBILITY_CAPACITY) + n) % _VISIBILITY_CAPACITY
+        else:
+            slots = np.arange(n)
         
         # Filter by time range if provided
         if time_range:
-            start_time = time.time() - time_range
-            data = [d for d in data if d.get('timestamp', 0) >= start_time]
-            
-        # Return the last N points
-        return data[-limit:]
+            slots = slots[buf['values'][0, slots] >= time.time() - time_range]
+        return buf, slots[-limit:]
+    
+    def get_visibility_data(self, camera_id, limit=100, time_range=None):
+        """Get visibility data for a camera"""
+        buf, slots = self._visibility_window(camera_id, limit, time_range)
+        if not len(slots):
+            return []
+        return [{**extra, **dict(zip(_VISIBILITY_FIELDS, sample))}
+                for extra, sample in zip(buf['extra'][slots], buf['values'][:, slots].T.tolist())]
     
     def get_visibility_stats(self, camera_id, time_range=None):
         """Get visibility statistics for a camera"""
-        data = self.get_visibility_data(camera_id, limit=1000, time_range=time_range)
+        buf, slots = self._visibility_window(camera_id, _VISIBILITY_CAPACITY, time_range)
         
-        if not data:
+        if not len(slots):
             return {}
             
-        # Calculate statistics
+        # Calculate statistics in one pass over the score, brightness and contrast rows
+        values = buf['values'][1:, slots]
+        means = values.mean(axis=1)
+        scores = values[0]
         stats = {
-            'avg_visibility_score': np.mean([d.get('visibility_score', 0) for d in data]),
-            'min_visibility_score': min([d.get('visibility_score', 0) for d in data]),
-            'max_visibility_score': max([d.get('visibility_score', 0) for d in data]),
-            'avg_brightness': np.mean([d.get('brightness', 0) for d in data]),
-            'avg_contrast': np.mean([d.get('contrast', 0) for d in data]),
-            'data_points': len(data),
+            'avg_visibility_score': float(means[0]),
+            'min_visibility_score': float(scores.min()),
+            'max_visibility_score': float(scores.max()),
+            'avg_brightness': float(means[1]),
+            'avg_contrast': float(means[2]),
+            'data_points': len(slots),
             'time_range': time_range
         }
         
         return stats
     
     def _save_data(self, camera_id):
-        """Save visibility data to disk"""
+        """Append the points added since the last save to the day's NDJSON file"""
         try:
+            buf = self.visibility_data[camera_id]
+            pending = buf['unsaved']
+            if not pending:
+                return
+            
             camera_data_dir = self.data_dir / camera_id
             camera_data_dir.mkdir(exist_ok=True)
             
             # Use current date for filename
             today = datetime.now().strftime("%Y-%m-%d")
-            data_file = camera_data_dir / f"visibility_{today}.json"
+            data_file = camera_data_dir / f"visibility_{today}.ndjson"
             
-            # Save to file
-            with open(data_file, 'w') as f:
-                json.dump(self.visibility_data[camera_id], f)
+            # Append one line per new point, with every field the caller stored
+            with open(data_file, 'a') as f:
+                f.writelines(json.dumps(row, default=str) + "\n" for row in pending)
+            buf['unsaved'] = []
                 
-            logger.debug(f"Saved visibility data for camera {camera_id} to {data_file}")
+            logger.debug(f"Saved {len(pending)} visibility points for camera {camera_id} to {data_file}")
         except Exception as e:
             logger.error(f"Error saving visibility data: {str(e)}") 
\ No newline at end of file